@@ -70,9 +70,7 @@ def RealtimeInformation():
     )
 
 def AnswerModifier(Answer):
-    lines = Answer.split('\n')
-    non_empty_lines = [line for line in lines if line.strip()]
-    return '\n'.join(non_empty_lines)
+    return '\n'.join([line for line in Answer.splitlines() if line.strip()])
 
 # --- App mappings ---
 def load_app_mappings():
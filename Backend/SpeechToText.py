@@ -1,13 +1,9 @@
-import os
 import re
 import sys
 import time
 import logging
-import threading
 import atexit
-from http.server import HTTPServer, SimpleHTTPRequestHandler
 from pathlib import Path
-from dotenv import load_dotenv
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -17,12 +13,16 @@ from selenium.webdriver.support.ui import WebDriverWait
 import mtranslate as mt
 import tempfile
 
-# ─── PATH HELPER ──────────────────────────────────────────────────────────────
-def resource_path(relative_path):
-    """Get absolute path for PyInstaller and dev mode"""
-    if hasattr(sys, '_MEIPASS'):
-        return os.path.join(sys._MEIPASS, relative_path)
-    return os.path.abspath(relative_path)
+from .config import CFG, resource_path
+
+# Optional local STT engine (faster-whisper on CTranslate2, fed by sounddevice)
+try:
+    import numpy as np
+    import sounddevice as sd
+    import webrtcvad
+    from faster_whisper import WhisperModel
+except ImportError:
+    WhisperModel = None
 
 # ─── CONFIG & LOGGING ─────────────────────────────────────────────────────────
 logging.basicConfig(
@@ -31,23 +31,72 @@ logging.basicConfig(
     handlers=[logging.StreamHandler()]
 )
 
-# Load environment variables from correct location
-load_dotenv(dotenv_path=resource_path('.env'))
+INPUT_LANGUAGE   = CFG.input_language
+SPEECH_TIMEOUT   = CFG.speech_timeout
+EDGE_DRIVER_PATH = resource_path(CFG.edge_driver_path)
+HEADLESS         = CFG.headless
+FAKE_AUDIO_PATH  = resource_path(CFG.fake_audio_path) if CFG.fake_audio_path else ""
+WHISPER_MODEL    = CFG.whisper_model
+# "whisper" transcribes locally in-process; "browser" drives the Web Speech API through Edge
+STT_ENGINE       = CFG.stt_engine or ("whisper" if WhisperModel else "browser")
+
+if STT_ENGINE == "whisper" and WhisperModel is None:
+    logging.warning("faster-whisper/sounddevice/webrtcvad not installed, falling back to browser STT")
+    STT_ENGINE = "browser"
 
-INPUT_LANGUAGE   = os.getenv("InputLanguage", "en-US")
-SPEECH_TIMEOUT   = int(os.getenv("SPEECH_TIMEOUT", "15"))
-EDGE_DRIVER_PATH = resource_path(os.getenv("EDGE_DRIVER_PATH", "Webdriver/msedgedriver.exe"))
-HEADLESS         = os.getenv("HEADLESS", "true").lower() in ("1","true","yes")
-FAKE_AUDIO_PATH  = resource_path(os.getenv("FAKE_AUDIO_PATH", ""))
+_MODEL = None
+_VAD = None
+if STT_ENGINE == "whisper":
+    # The first load downloads the model from the Hugging Face Hub; being offline, behind a
+    # proxy or out of disk must not make the whole module unusable
+    try:
+        _MODEL = WhisperModel(WHISPER_MODEL, device="cpu", compute_type="int8")
+        _VAD = webrtcvad.Vad(2)
+        logging.info(f"Loaded Whisper model '{WHISPER_MODEL}' (int8, cpu)")
+    except Exception as e:
+        logging.warning(f"Could not load Whisper model '{WHISPER_MODEL}' ({e}), falling back to browser STT")
+        _MODEL = None
+        STT_ENGINE = "browser"
 
 # Validate critical paths
-if not Path(EDGE_DRIVER_PATH).exists():
+if STT_ENGINE == "browser" and not Path(EDGE_DRIVER_PATH).exists():
     raise FileNotFoundError(f"EdgeDriver not found at: {EDGE_DRIVER_PATH}")
 
-# ─── HTML SERVER SETUP ────────────────────────────────────────────────────────
-DATA_DIR = Path(resource_path("Data"))
-HTML_PATH = DATA_DIR / "Voice.html"
+# ─── LOCAL WHISPER ENGINE ─────────────────────────────────────────────────────
+SAMPLE_RATE      = 16000
+FRAME_MS         = 30
+FRAME_SAMPLES    = SAMPLE_RATE * FRAME_MS // 1000
+END_SILENCE_MS   = 800    # trailing silence that ends an utterance
+MAX_UTTERANCE_S  = 30
+
+def record_utterance() -> "np.ndarray | None":
+    """Record one VAD-bounded utterance from the default microphone as float32 PCM."""
+    frames = []
+    speech_started = False
+    silence_frames = 0
+    max_silence = END_SILENCE_MS // FRAME_MS
+    start_deadline = time.monotonic() + SPEECH_TIMEOUT
+    max_frames = MAX_UTTERANCE_S * 1000 // FRAME_MS
+
+    with sd.InputStream(samplerate=SAMPLE_RATE, channels=1, dtype="int16",
+                        blocksize=FRAME_SAMPLES) as stream:
+        while len(frames) < max_frames:
+            block, _ = stream.read(FRAME_SAMPLES)
+            is_speech = _VAD.is_speech(block.tobytes(), SAMPLE_RATE)
+            if not speech_started:
+                if not is_speech:
+                    if time.monotonic() > start_deadline:
+                        return None
+                    continue
+                speech_started = True
+            frames.append(block.copy())
+            silence_frames = 0 if is_speech else silence_frames + 1
+            if silence_frames >= max_silence:
+                break
+
+    return np.concatenate(frames)[:, 0].astype(np.float32) / 32768.0
 
+# ─── SPEECH PAGE ──────────────────────────────────────────────────────────────
 HTML_CONTENT = f"""<!DOCTYPE html>
 <html lang="en">
 <head><meta charset="utf-8"><title>Speech Recognition</title></head>
@@ -80,25 +129,11 @@ HTML_CONTENT = f"""<!DOCTYPE html>
 </body>
 </html>"""
 
-DATA_DIR.mkdir(exist_ok=True)
-HTML_PATH.write_text(HTML_CONTENT, encoding="utf-8")
-logging.info(f"Created speech HTML at: {HTML_PATH}")
-
-class CustomHTTPRequestHandler(SimpleHTTPRequestHandler):
-    def log_message(self, format, *args):
-        pass  # Silence HTTP server logs
-
-def run_server():
-    """Run HTTP server in background with diagnostics"""
-    serve_dir = str(DATA_DIR)
-    print("Serving from:", serve_dir)
-    print("Voice.html exists:", os.path.exists(os.path.join(serve_dir, "Voice.html")))
-    os.chdir(serve_dir)
-    server = HTTPServer(("localhost", 8000), CustomHTTPRequestHandler)
-    threading.Thread(target=server.serve_forever, daemon=True).start()
-    logging.info("Speech server started at http://localhost:8000/Voice.html")
-
-run_server()
+# Written once and loaded from a file: URL, no local server needed. A data: URL would be an
+# opaque, non-secure origin, and Edge refuses microphone access to Web Speech there.
+DATA_DIR = Path(__file__).resolve().parent.parent / "Data"
+VOICE_PAGE = DATA_DIR / "Voice.html"
+PAGE_URL = VOICE_PAGE.as_uri()
 
 # ─── BROWSER CONFIGURATION ────────────────────────────────────────────────────
 def configure_browser():
@@ -112,6 +147,13 @@ def configure_browser():
         opts.add_argument(f"--use-file-for-fake-audio-capture={FAKE_AUDIO_PATH}")
     if HEADLESS:
         opts.add_argument("--headless=new")
+    # The page has no images, GPU work or extensions; skip that renderer setup
+    opts.add_argument("--disable-gpu")
+    opts.add_argument("--disable-extensions")
+    opts.add_argument("--disable-dev-shm-usage")
+    opts.add_argument("--no-sandbox")
+    opts.add_argument("--blink-settings=imagesEnabled=false")
+    opts.add_experimental_option("excludeSwitches", ["enable-automation", "enable-logging"])
     opts.add_argument(
         "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
         "AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -120,28 +162,42 @@ def configure_browser():
     return opts
 
 MAX_RETRIES = 3
-driver = None
-for attempt in range(MAX_RETRIES):
-    try:
-        service = Service(executable_path=EDGE_DRIVER_PATH)
-        driver = webdriver.Edge(service=service, options=configure_browser())
-        atexit.register(driver.quit)
-        logging.info("Edge browser started successfully")
-        break
-    except Exception as e:
-        logging.warning(f"Browser start attempt {attempt+1} failed: {e}")
-        time.sleep(2)
-if not driver:
+
+def start_browser():
+    """Launch Edge with retries; exits the process if it never comes up"""
+    for attempt in range(MAX_RETRIES):
+        try:
+            service = Service(executable_path=EDGE_DRIVER_PATH, service_args=["--log-level=OFF"])
+            browser = webdriver.Edge(service=service, options=configure_browser())
+            atexit.register(browser.quit)
+            logging.info("Edge browser started successfully")
+            return browser
+        except Exception as e:
+            logging.warning(f"Browser start attempt {attempt+1} failed: {e}")
+            time.sleep(2)
     logging.error("Failed to start Edge browser after multiple attempts")
     sys.exit(1)
 
+driver = None
+if STT_ENGINE == "browser":
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    VOICE_PAGE.write_text(HTML_CONTENT, encoding="utf-8")
+    driver = start_browser()
+
 # ─── SPEECH RECOGNITION ────────────────────────────────────────────────────────
+# Each script is a single WebDriver round-trip (find_element + .text would be two)
+_GET_OUTPUT = "return document.getElementById('output').textContent.trim()"
+_CLICK_START = "document.getElementById('start').click()"
+_CLICK_END = "document.getElementById('end').click()"
+
+_QUESTION_RE = re.compile(r"(?:how|what|who|where|when|why|which)\b", re.I)
+
 def QueryModifier(text: str) -> str:
     text = text.strip()
     if not text:
         return ""
     if text[-1] not in ".?!":
-        text += "?" if re.match(r"^(how|what|who|where|when|why|which)\b", text, re.I) else "."
+        text += "?" if _QUESTION_RE.match(text) else "."
     return text[0].upper() + text[1:]
 
 def UniversalTranslator(text: str) -> str:
@@ -151,18 +207,39 @@ def UniversalTranslator(text: str) -> str:
         logging.error(f"Translation failed: {e}")
         return text
 
+def WhisperRecognition() -> str | None:
+    try:
+        audio = record_utterance()
+        if audio is None:
+            logging.info("No speech detected before timeout")
+            return None
+        english = INPUT_LANGUAGE.lower().startswith("en")
+        segments, _ = _MODEL.transcribe(
+            audio,
+            language=INPUT_LANGUAGE.split("-")[0].lower(),
+            task="transcribe" if english else "translate",
+            vad_filter=True,
+        )
+        raw_text = " ".join(seg.text.strip() for seg in segments).strip()
+        logging.info(f"Raw input: {raw_text}")
+        return QueryModifier(raw_text) or None
+    except Exception as e:
+        logging.warning(f"Recognition failed: {e}")
+        return None
+
 def SpeechRecognition() -> str | None:
+    if STT_ENGINE == "whisper":
+        return WhisperRecognition()
     try:
-        driver.get("http://localhost:8000/Voice.html")
+        driver.get(PAGE_URL)
         WebDriverWait(driver, 10).until(
             lambda d: d.find_element(By.ID, "start").is_displayed()
         )
-        driver.find_element(By.ID, "start").click()
+        driver.execute_script(_CLICK_START)
         time.sleep(1)
-        WebDriverWait(driver, SPEECH_TIMEOUT).until(
-            lambda d: d.find_element(By.ID, "output").text.strip() != ""
+        raw_text = WebDriverWait(driver, SPEECH_TIMEOUT).until(
+            lambda d: d.execute_script(_GET_OUTPUT)
         )
-        raw_text = driver.find_element(By.ID, "output").text.strip()
         logging.info(f"Raw input: {raw_text}")
         return (
             QueryModifier(raw_text)
@@ -174,7 +251,7 @@ def SpeechRecognition() -> str | None:
         return None
     finally:
         try:
-            driver.find_element(By.ID, "end").click()
+            driver.execute_script(_CLICK_END)
         except:
             pass
 
@@ -1,21 +1,17 @@
-import os
-import sys
+import re
+import atexit
 import logging
 import random
 import asyncio
+import threading
+from collections import deque
 from pathlib import Path
 from typing import Callable
 import pygame
 import edge_tts
 import keyboard
-from dotenv import load_dotenv
 
-# ─── PATH HANDLING ────────────────────────────────────────────────────────────
-def resource_path(relative_path):
-    """Get absolute path to resource, works for dev and for PyInstaller"""
-    if hasattr(sys, '_MEIPASS'):
-        return os.path.join(sys._MEIPASS, relative_path)
-    return os.path.abspath(relative_path)
+from .config import CFG, resource_path
 
 # ─── CONFIG & LOGGING ─────────────────────────────────────────────────────────
 logging.basicConfig(
@@ -24,28 +20,38 @@ logging.basicConfig(
     handlers=[logging.StreamHandler(), logging.FileHandler(resource_path('tts.log'))]
 )
 
-# Load environment variables from correct location
-load_dotenv(dotenv_path=resource_path('.env'))
-
-def resource_path(relative_path: str) -> Path:
-    # Mimics the behavior of ROOT_DIR = Path(__file__).resolve().parent.parent
-    root_dir = Path(__file__).resolve().parent.parent
-    return root_dir / relative_path
-
-# Now you can use it like this:
-DATA_DIR = Path(resource_path("Data"))
+# ─── PATH SETUP ────────────────────────────────────────────────────────────────
+_HERE = Path(__file__).resolve()
+ROOT_DIR = _HERE.parent.parent
+DATA_DIR = ROOT_DIR / "Data"
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 AUDIO_FILE = DATA_DIR / "speech.mp3"
 
+# ─── AUDIO DEVICE ─────────────────────────────────────────────────────────────
+# Open the mixer once; edge_tts emits 24 kHz mono, so SDL doesn't need to resample
+_mixer_ready = False
 
-# ─── PATH SETUP ────────────────────────────────────────────────────────────────
-ROOT_DIR = Path(__file__).resolve().parent.parent
-DATA_DIR = ROOT_DIR / "Data"
-DATA_DIR.mkdir(exist_ok=True)
-AUDIO_FILE = DATA_DIR / "speech.mp3"
+def _init_mixer() -> bool:
+    """Opens the audio device if it isn't open yet; returns whether playback is possible"""
+    global _mixer_ready
+    if not _mixer_ready:
+        try:
+            pygame.mixer.init(frequency=24000, size=-16, channels=1, buffer=1024)
+            atexit.register(pygame.mixer.quit)
+            _mixer_ready = True
+        except pygame.error as e:
+            # No audio device: keep the module importable and retry at the next playback
+            logging.error(f"Audio device unavailable: {e}")
+    return _mixer_ready
+
+_init_mixer()
+
+# Stop key: one global hook sets a flag instead of polling key state every tick
+_STOP = threading.Event()
+keyboard.add_hotkey("s", _STOP.set, suppress=False)
 
 # ─── VOICE CONFIG ─────────────────────────────────────────────────────────────
-DEFAULT_VOICE = os.getenv("TTS_VOICE", "en-US-JennyNeural")
+DEFAULT_VOICE = CFG.tts_voice
 logging.info(f"Initialized TTS with voice: {DEFAULT_VOICE}")
 
 # ─── RESPONSE TEMPLATES ───────────────────────────────────────────────────────
@@ -54,13 +60,27 @@ RESPONSES = [
     # ... (keep your existing response templates)
 ]
 
+# Short answers are always read in full; longer ones are trimmed to a snippet
+# unless the opening asks for detail
+SHORT_TEXT_CHARS = 250
+TRIGGER_SCAN_CHARS = 400
+_DETAIL_TRIGGERS = re.compile(r"\b(?:in detail|complete|fully|elaborate)\b", re.IGNORECASE)
+
+_rr_state = threading.local()
+
+def _next_response() -> str:
+    """Round-robin through a shuffled copy of RESPONSES, reshuffling after each pass"""
+    order = getattr(_rr_state, "order", None)
+    if not order:
+        order = _rr_state.order = deque(random.sample(RESPONSES, len(RESPONSES)))
+    return order.popleft()
+
 # ─── CORE FUNCTIONS ───────────────────────────────────────────────────────────
 async def generate_audio_file(text: str) -> bool:
     """Generate TTS audio file from text"""
     try:
-        if AUDIO_FILE.exists():
-            AUDIO_FILE.unlink()
-            
+        AUDIO_FILE.unlink(missing_ok=True)
+
         logging.info(f"Generating TTS audio: {text[:50]}...")
         communicator = edge_tts.Communicate(text=text, voice=DEFAULT_VOICE)
         await communicator.save(str(AUDIO_FILE))
@@ -71,14 +91,16 @@ async def generate_audio_file(text: str) -> bool:
 
 def play_audio_with_control(callback: Callable[[bool], bool] = lambda _: True) -> bool:
     """Play generated audio with playback control"""
+    if not _init_mixer():
+        return False
     try:
-        pygame.mixer.init()
         pygame.mixer.music.load(str(AUDIO_FILE))
+        _STOP.clear()
         pygame.mixer.music.play()
         logging.info("Playback started")
 
         while pygame.mixer.music.get_busy():
-            if keyboard.is_pressed("s"):  # Stop on 's' key press
+            if _STOP.is_set():  # Stop on 's' key press
                 logging.info("Playback stopped by user")
                 pygame.mixer.music.stop()
                 return False
@@ -93,26 +115,22 @@ def play_audio_with_control(callback: Callable[[bool], bool] = lambda _: True) -
     finally:
         try:
             pygame.mixer.music.stop()
-            pygame.mixer.quit()
+            pygame.mixer.music.unload()  # release speech.mp3 so it can be rewritten
         except Exception:
             pass
 
 def text_to_speech(text: str, callback: Callable[[bool], bool] = lambda _: True) -> None:
     """Main TTS entry point with smart response handling"""
     try:
-        if not asyncio.run(generate_audio_file(text)):
-            return
-
-        lowered = text.lower()
-        sentences = [s.strip() for s in text.split('.') if s.strip()]
-        detailed_triggers = {"in detail", "complete", "fully", "elaborate"}
-
-        if detailed_triggers.intersection(lowered.split()) or len(sentences) <= 3:
+        # Pick what will be spoken first so only that one clip is synthesized
+        spoken = text
+        if len(text) >= SHORT_TEXT_CHARS and not _DETAIL_TRIGGERS.search(text, 0, TRIGGER_SCAN_CHARS):
+            sentences = [s.strip() for s in text.split('.') if s.strip()]
+            if len(sentences) > 3:
+                spoken = '. '.join(sentences[:2]) + '. ' + _next_response()
+
+        if asyncio.run(generate_audio_file(spoken)):
             play_audio_with_control(callback)
-        else:
-            snippet = '. '.join(sentences[:2]) + '. ' + random.choice(RESPONSES)
-            if asyncio.run(generate_audio_file(snippet)):
-                play_audio_with_control(callback)
     except Exception as e:
         logging.error(f"TTS processing failed: {str(e)}")
 
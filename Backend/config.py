@@ -0,0 +1,53 @@
+"""
+config.py
+Shared settings for the speech Backend modules.
+The .env file is parsed once per process; real environment variables win over it,
+matching load_dotenv's default of not overriding what is already set.
+"""
+
+import os
+import sys
+from dataclasses import dataclass
+from functools import cache
+
+from dotenv import dotenv_values
+
+# --- Helper for PyInstaller path resolution ---
+def resource_path(relative_path):
+    """Get absolute path to resource, works for dev and for PyInstaller"""
+    if hasattr(sys, '_MEIPASS'):
+        return os.path.join(sys._MEIPASS, relative_path)
+    return os.path.abspath(relative_path)
+
+_TRUTHY = frozenset(("1", "true", "yes"))
+
+
+@dataclass(frozen=True)
+class Cfg:
+    input_language: str
+    speech_timeout: int
+    edge_driver_path: str
+    headless: bool
+    fake_audio_path: str
+    stt_engine: str      # "" lets SpeechToText pick based on installed packages
+    whisper_model: str
+    tts_voice: str
+
+
+@cache
+def get_config() -> Cfg:
+    """Parse .env + process environment once and return typed settings."""
+    env = {**dotenv_values(resource_path('.env')), **os.environ}
+    return Cfg(
+        input_language=env.get("InputLanguage") or "en-US",
+        speech_timeout=int(env.get("SPEECH_TIMEOUT") or 15),
+        edge_driver_path=env.get("EDGE_DRIVER_PATH") or "Webdriver/msedgedriver.exe",
+        headless=(env.get("HEADLESS") or "true").strip().lower() in _TRUTHY,
+        fake_audio_path=env.get("FAKE_AUDIO_PATH") or "",
+        stt_engine=(env.get("STT_ENGINE") or "").strip().lower(),
+        whisper_model=env.get("WHISPER_MODEL") or "small",
+        tts_voice=env.get("TTS_VOICE") or "en-US-JennyNeural",
+    )
+
+
+CFG = get_config()
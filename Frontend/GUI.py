@@ -2,30 +2,28 @@
 import sys
 import os
 import platform
-import traceback
+import re
+import atexit
+import threading
 import logging
+from collections import deque
+from functools import lru_cache
 from typing import Optional, Tuple, Union
 
 # --- PyQt5 Imports ---
 # Using try-except to handle potential ImportError if PyQt5 is not installed
 try:
-    from PyQt5.QtWidgets import (QApplication, QMainWindow, QTextEdit, QStackedWidget,
+    from PyQt5.QtWidgets import (QApplication, QMainWindow, QPlainTextEdit, QStackedWidget,
                                  QWidget, QLineEdit, QGridLayout, QVBoxLayout, QHBoxLayout,
                                  QPushButton, QLabel, QSizePolicy, QFrame, QDesktopWidget)
     from PyQt5.QtGui import (QIcon, QPainter, QMovie, QColor, QTextCharFormat, QFont,
-                             QPixmap, QTextBlockFormat, QScreen, QTextCursor)
-    from PyQt5.QtCore import (Qt, QSize, QTimer, QEvent, QPoint, QRect, pyqtSignal, QObject) # Added pyqtSignal, QObject
+                             QPixmap, QImage, QTextBlockFormat, QScreen, QTextCursor)
+    from PyQt5.QtCore import (Qt, QSize, QTimer, QEvent, QPoint, QRect, pyqtSignal, pyqtSlot, QObject,
+                              QFileSystemWatcher, QRunnable, QThreadPool)
 except ImportError:
     print("ERROR: PyQt5 library not found. Please install it using 'pip install PyQt5'")
     sys.exit(1) # Exit if PyQt5 is missing
 
-# --- Other Imports ---
-try:
-    from dotenv import dotenv_values
-except ImportError:
-    print("Warning: python-dotenv library not found. .env file will not be loaded. Install using 'pip install python-dotenv'")
-    dotenv_values = None # Define a fallback
-
 # --- Logging Setup ---
 # Configure logging to output to console
 logging.basicConfig(
@@ -37,18 +35,24 @@ log = logging.getLogger(__name__) # Get a logger instance for this module
 
 # --- Helper Functions ---
 
-def resource_path(relative_path: str) -> str:
-    """Get absolute path to resource, works for dev and PyInstaller."""
+def _resource_base_path() -> str:
+    """Base directory for bundled resources: PyInstaller's _MEIPASS, else the working directory."""
     try:
         # PyInstaller creates a temp folder and stores path in _MEIPASS
         base_path = str(sys._MEIPASS)
-        log.debug(f"Running bundled (PyInstaller detected _MEIPASS): {base_path}")
+        log.debug("Running bundled (PyInstaller detected _MEIPASS): %s", base_path)
     except AttributeError:
         # If not running as a bundled app, use the script's directory
         base_path = os.path.abspath(".")
-        log.debug(f"Running from script, base path: {base_path}")
+        log.debug("Running from script, base path: %s", base_path)
+    return base_path
+
+# Resolved once at import rather than on every resource lookup
+_RESOURCE_BASE_PATH = _resource_base_path()
 
-    full_path = os.path.join(base_path, relative_path)
+def resource_path(relative_path: str) -> str:
+    """Get absolute path to resource, works for dev and PyInstaller."""
+    full_path = os.path.join(_RESOURCE_BASE_PATH, relative_path)
     # log.debug(f"Resolved resource path for '{relative_path}' to '{full_path}'") # Can be noisy
     return full_path
 
@@ -72,21 +76,37 @@ ENV_PATH = os.path.join(SCRIPT_DIR, '.env')
 TEMP_DIR_PATH = os.path.join(SCRIPT_DIR, "Files")
 # Graphics directory relative to script/exe (ensure it's included by PyInstaller)
 GRAPHICS_DIR = os.path.join("Graphics") # Relative path for resource_path
+GRAPHICS_DIR_PATH = resource_path(GRAPHICS_DIR) # Absolute, resolved once
 
 # --- Load Environment Variables ---
+
+def read_env_value(env_path: str, key: str) -> Optional[str]:
+    """Returns one KEY=value entry from a .env file without a full dotenv parse (None if absent)."""
+    with open(env_path, "r", encoding="utf-8") as env_file:
+        for line in env_file:
+            name, sep, value = line.partition("=")
+            if not sep or name.strip() != key:
+                continue
+            value = value.strip()
+            if value[:1] in ("'", '"'):
+                end = value.find(value[0], 1)
+                return value[1:end] if end > 0 else value[1:]
+            return value.split(" #", 1)[0].strip() # Drop inline comments on unquoted values
+    return None
+
 ASSISTANT_NAME = "Assistant" # Default value
-if dotenv_values:
-    try:
-        if os.path.exists(ENV_PATH):
-            env_vars = dotenv_values(ENV_PATH)
-            ASSISTANT_NAME = env_vars.get("Assistantname", ASSISTANT_NAME)
-            log.info(f"Loaded Assistantname '{ASSISTANT_NAME}' from {ENV_PATH}")
-        else:
-            log.warning(f".env file not found at '{ENV_PATH}'. Using default values.")
-    except Exception as e:
-        log.error(f"Could not load .env file. Using default values. Error: {e}", exc_info=True)
-else:
-    log.warning("python-dotenv not installed, cannot load .env file.")
+try:
+    if os.path.exists(ENV_PATH):
+        ASSISTANT_NAME = read_env_value(ENV_PATH, "Assistantname") or ASSISTANT_NAME
+        log.info(f"Loaded Assistantname '{ASSISTANT_NAME}' from {ENV_PATH}")
+    else:
+        log.warning(f".env file not found at '{ENV_PATH}'. Using default values.")
+except Exception as e:
+    log.error(f"Could not load .env file. Using default values. Error: {e}", exc_info=True)
+
+# Window and top bar titles, formatted once from the configured name
+WINDOW_TITLE = f"{ASSISTANT_NAME.capitalize()} AI"
+TOP_BAR_TITLE = f" {ASSISTANT_NAME.capitalize()}"
 
 # --- Ensure Persistent Data Directory Exists ---
 try:
@@ -103,19 +123,88 @@ STATUS_DATA_FILE = os.path.join(TEMP_DIR_PATH, "Status.data")
 RESPONSES_DATA_FILE = os.path.join(TEMP_DIR_PATH, "Responses.data")
 GENERATED_IMAGE_DATA_FILE = os.path.join(TEMP_DIR_PATH, "GeneratedImage.data")
 
-# --- Global State (Minimize usage - consider passing state or using signals) ---
-# This is kept for now to match the original structure, but ideally ChatSection manages its own state
-old_chat_message = ""
+# Contents a data file starts with (and reads as) when it is missing
+_DATA_FILE_DEFAULTS = {
+    MIC_DATA_FILE: "False",
+    STATUS_DATA_FILE: "Initializing...",
+    RESPONSES_DATA_FILE: "",
+    GENERATED_IMAGE_DATA_FILE: "",
+}
+
+STATUS_PREFIX = "Status: "
+INITIAL_STATUS_TEXT = STATUS_PREFIX + "Initializing..."
+
+# Statuses the backend sets over and over; mapping reads onto these shared objects lets
+# an unchanged status be spotted by identity, and their label text is built only once
+_KNOWN_STATUSES = {s: s for s in (
+    "Initializing...", "Available...", "Listening...", "Thinking...", "Searching...",
+    "Answering...", "Generating Image...", "Opening URL...", "Shutting down...",
+    "Error!", "EXIT_REQUESTED", "Idle", "Unknown",
+)}
+_STATUS_LABELS = {s: STATUS_PREFIX + s for s in _KNOWN_STATUSES}
+
+def status_label_text(status: str) -> str:
+    """Returns the status label text ("Status: ..."), showing 'Idle' for an empty status."""
+    status = status or "Idle"
+    label = _STATUS_LABELS.get(status)
+    return label if label is not None else STATUS_PREFIX + status
+
+# Safety-net poll interval; normal updates arrive through the file watcher
+DATA_POLL_FALLBACK_MS = 2000
+
+# --- Chat Display Limits ---
+CHAT_MAX_BLOCKS = 500          # Oldest messages are dropped beyond this many blocks
+CHAT_MAX_MESSAGE_CHARS = 4000  # Longer messages are cropped before insertion
 
 # --- File I/O Helper Functions ---
 
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+# Last known contents per path, keyed by (st_mtime_ns, st_size) so unchanged files skip the read
+_file_cache: dict[str, Tuple[int, int, str]] = {}
+# (st_mtime_ns, st_size) of the last write this process made to each path; readers use it to
+# skip changes that already reached the GUI through backend_bridge
+_own_write_stats: dict[str, Tuple[int, int]] = {}
+
+def atomic_write_bytes(filepath: str, data: bytes):
+    """Writes data to a private temp file, then renames it over filepath, so readers (the GUI,
+    Main.py, the Backend modules) never observe a truncated or half-written file."""
+    tmp_path = f"{filepath}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        fd = os.open(tmp_path, _WRITE_FLAGS, 0o644)
+    except FileNotFoundError:
+        # The data directories are created at import; only recreate one if it was removed since
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        fd = os.open(tmp_path, _WRITE_FLAGS, 0o644)
+    try:
+        try:
+            # Usually one syscall; os.write may write less than asked, so finish the rest
+            remaining = memoryview(data)
+            while remaining:
+                remaining = remaining[os.write(fd, remaining):]
+        finally:
+            os.close(fd)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    try:
+        os.replace(tmp_path, filepath)
+    except PermissionError:
+        # Windows refuses the rename while another process holds the target open
+        os.remove(tmp_path)
+        with open(filepath, "wb") as file:
+            file.write(data)
+
 def _safe_file_write(filepath: str, content: str):
     """Safely writes content to a file."""
     try:
-        # Ensure directory exists before writing (redundant if TEMP_DIR_PATH check passed, but safe)
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
-        with open(filepath, "w", encoding='utf-8') as file:
-            file.write(content)
+        atomic_write_bytes(filepath, content.encode('utf-8'))
+        st = os.stat(filepath)
+        _file_cache[filepath] = (st.st_mtime_ns, st.st_size, content)
+        _own_write_stats[filepath] = (st.st_mtime_ns, st.st_size)
         # log.debug(f"Successfully wrote to {filepath}") # Optional: uncomment for verbose logging
     except IOError as e:
         log.error(f"Error writing to file {filepath}: {e}", exc_info=True)
@@ -123,97 +212,312 @@ def _safe_file_write(filepath: str, content: str):
         log.error(f"Unexpected error writing to file {filepath}: {e}", exc_info=True)
 
 def _safe_file_read(filepath: str) -> Optional[str]:
-    """Safely reads content from a file, creating it with defaults if missing."""
+    """Safely reads content from a file, recreating it with its default if missing."""
     try:
-        filename = os.path.basename(filepath)
-        # Ensure directory exists before reading/writing
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
-
-        if not os.path.exists(filepath):
-            default_content = ""
-            if filename == os.path.basename(MIC_DATA_FILE):
-                default_content = "False"
-            elif filename == os.path.basename(STATUS_DATA_FILE):
-                default_content = "Initializing..."
-            elif filename == os.path.basename(RESPONSES_DATA_FILE):
-                default_content = "" # Default responses is empty
-            elif filename == os.path.basename(GENERATED_IMAGE_DATA_FILE):
-                 default_content = "" # Default is empty path
-
+        # The data files are created at import, so a missing file is the rare path
+        try:
+            st = os.stat(filepath)
+        except FileNotFoundError:
+            default_content = _DATA_FILE_DEFAULTS.get(filepath, "")
             log.warning(f"File '{filepath}' not found. Creating with default content: '{default_content}'")
             _safe_file_write(filepath, default_content)
             return default_content # Return the default immediately
 
-        # If file exists, read it
-        with open(filepath, "r", encoding='utf-8') as file:
-            content = file.read()
+        # Read the file unless it is unchanged since the last read/write
+        cached = _file_cache.get(filepath)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+        # Raw read + one decode; skips building a TextIOWrapper for a file read in one go
+        with open(filepath, "rb") as file:
+            content = file.read().decode('utf-8')
             # log.debug(f"Successfully read from {filepath}") # Optional: uncomment for verbose logging
-            return content
+        _file_cache[filepath] = (st.st_mtime_ns, st.st_size, content)
+        return content
     except IOError as e:
         log.error(f"IOError reading from file {filepath}: {e}", exc_info=True)
     except Exception as e:
         log.error(f"Unexpected error reading file {filepath}: {e}", exc_info=True)
 
-    # Fallback return if reading failed after file existence check
+    # Fallback return if reading the file failed
     log.warning(f"Failed to read existing file {filepath}. Returning default based on filename.")
-    filename = os.path.basename(filepath)
-    if filename == os.path.basename(MIC_DATA_FILE): return "False"
-    if filename == os.path.basename(STATUS_DATA_FILE): return "Initializing..."
-    if filename == os.path.basename(GENERATED_IMAGE_DATA_FILE): return ""
-    return "" # Default fallback
+    return _DATA_FILE_DEFAULTS.get(filepath, "") # Default fallback
 
-# --- Status/Data Management Functions (Using Files - Replace with Signals/IPC if possible) ---
+def _create_data_file_if_missing(filepath: str, content: str):
+    """Creates filepath with content unless it exists; O_EXCL makes check + create a single open()."""
+    try:
+        fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0), 0o644)
+    except FileExistsError:
+        return # Keep whatever state the last run left behind
+    try:
+        os.write(fd, content.encode('utf-8'))
+    finally:
+        os.close(fd)
+
+# Create any missing data files up front so reads never need an existence check
+for _path, _default in _DATA_FILE_DEFAULTS.items():
+    try:
+        _create_data_file_if_missing(_path, _default)
+    except OSError as e:
+        log.error(f"Could not create data file {_path}: {e}")
+
+class CoalescingFileWriter:
+    """Writes only the latest of a burst of contents to one file, at most once per delay.
+
+    The first schedule() arms a timer; later calls before it fires just replace the
+    pending content, so N rapid updates cost one write instead of N.
+    """
+    def __init__(self, filepath: str, delay: float = 0.05):
+        self.filepath = filepath
+        self.delay = delay
+        self._lock = threading.Lock()
+        self._pending: Optional[str] = None
+        self._timer: Optional[threading.Timer] = None
+
+    def schedule(self, content: str):
+        with self._lock:
+            self._pending = content
+            if self._timer is None:
+                self._timer = threading.Timer(self.delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def pending(self) -> Optional[str]:
+        """Content scheduled but not yet on disk, or None."""
+        return self._pending
+
+    def flush(self):
+        """Writes the pending content now (timer callback, and at exit)."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            # Written under the lock so pending() stays set until the file has the content
+            if self._pending is not None:
+                _safe_file_write(self.filepath, self._pending)
+                self._pending = None
+
+# Responses.data only matters to out-of-process readers (the GUI gets replies through
+# backend_bridge), so bursts of replies only need the last one on disk
+_responses_writer = CoalescingFileWriter(RESPONSES_DATA_FILE)
+atexit.register(_responses_writer.flush)
+# A cycle sets several statuses back to back; the GUI is told at once through backend_bridge
+# and Status.data only needs the one that sticks
+_status_writer = CoalescingFileWriter(STATUS_DATA_FILE, delay=0.02)
+atexit.register(_status_writer.flush)
+
+# --- In-Process Backend Bridge ---
+
+class BackendBridge(QObject):
+    """Carries backend updates to the GUI as Qt signals.
+
+    Main.py's worker thread calls the set_*/show_* helpers below in the GUI's own process, so
+    emitting here delivers each update as a queued call on the GUI thread; the data files are
+    still written for anything outside the process.
+    """
+    status_changed = pyqtSignal(str)
+    mic_changed = pyqtSignal(bool)
+    response_appended = pyqtSignal(str)
+    responses_appended = pyqtSignal(list)
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        # Responses shown before the chat view exists (e.g. history loaded at startup)
+        self._responses: deque = deque(maxlen=CHAT_MAX_BLOCKS)
+        self._lock = threading.Lock()
+
+    def append_response(self, text: str):
+        with self._lock:
+            self._responses.append(text)
+            self.response_appended.emit(text)
+
+    def append_responses(self, texts: list):
+        """Appends several responses with a single signal (e.g. chat history at startup)."""
+        with self._lock:
+            self._responses.extend(texts)
+            self.responses_appended.emit(texts)
+
+    def connect_responses(self, slot, batch_slot):
+        """Replays earlier responses to slot, then connects slot (one text) and batch_slot (a
+        list) for new ones, with no gap or repeat."""
+        with self._lock:
+            for text in self._responses:
+                slot(text)
+            self.response_appended.connect(slot)
+            self.responses_appended.connect(batch_slot)
+
+# Created at import, on the thread that owns the GUI
+backend_bridge = BackendBridge()
+
+# --- Status/Data Management Functions (files kept for out-of-process readers) ---
+
+# In-process copy of Mic.data; the GUI and the backend thread share it, so the file
+# only needs to be read until the first write
+_mic_status_mirror: Optional[bool] = None
+# Set while the mic is on, so the backend's listen loop can block instead of polling
+_mic_on_event = threading.Event()
 
 def set_microphone_status(command: bool):
-    """Sets the microphone status ('True' or 'False') in Mic.data."""
+    """Sets the microphone status ('True' or 'False') in Mic.data and notifies the GUI."""
+    global _mic_status_mirror
     _safe_file_write(MIC_DATA_FILE, str(command))
-    log.info(f"Microphone status set to: {command}")
+    _mic_status_mirror = bool(command)
+    if _mic_status_mirror:
+        _mic_on_event.set()
+    else:
+        _mic_on_event.clear()
+    backend_bridge.mic_changed.emit(_mic_status_mirror)
+    log.debug("Microphone status set to: %s", command)
 
 def get_microphone_status() -> bool:
-    """Gets the microphone status from Mic.data."""
+    """Gets the microphone status, from the in-process mirror once it has been set."""
+    if _mic_status_mirror is not None:
+        return _mic_status_mirror
     status_str = _safe_file_read(MIC_DATA_FILE)
-    return str(status_str).strip().lower() == "true"
+    if status_str == "True" or status_str == "False": # What set_microphone_status writes
+        return status_str == "True"
+    return str(status_str).strip().lower() == "true" # Hand-edited or legacy content
+
+def wait_for_microphone_on(timeout: Optional[float] = None) -> bool:
+    """Blocks until set_microphone_status(True) (or the timeout); returns whether the mic is on."""
+    return _mic_on_event.wait(timeout)
 
 def set_assistant_status(status: str):
-    """Sets the assistant's current status text in Status.data."""
-    _safe_file_write(STATUS_DATA_FILE, status)
+    """Sets the assistant's current status text in Status.data (coalesced) and notifies the GUI."""
+    _status_writer.schedule(status)
+    backend_bridge.status_changed.emit(status)
     # log.debug(f"Assistant status set to: {status}") # Can be noisy
 
 def get_assistant_status() -> str:
-    """Gets the assistant's current status text from Status.data."""
-    return _safe_file_read(STATUS_DATA_FILE) or "Unknown" # Ensure it returns a string
+    """Gets the assistant's current status text (a pending write, else Status.data)."""
+    status = _status_writer.pending() or _safe_file_read(STATUS_DATA_FILE) or "Unknown" # Ensure it returns a string
+    return _KNOWN_STATUSES.get(status, status)
 
 def show_text_to_screen(text: str):
-    """Writes text to the Responses.data file for display."""
-    _safe_file_write(RESPONSES_DATA_FILE, text)
+    """Writes text to the Responses.data file (coalesced) and sends it to the chat view.
+
+    Callers need not run answer_modifier first: the chat view applies it on display.
+    """
+    _responses_writer.schedule(text)
+    backend_bridge.append_response(text)
+
+def show_texts_to_screen(texts: list):
+    """show_text_to_screen for several messages: one file write and one GUI notification."""
+    if not texts:
+        return
+    _responses_writer.schedule(texts[-1]) # The file holds the latest message, as before
+    backend_bridge.append_responses(texts)
     # log.debug(f"Wrote to Responses.data: '{text[:50]}...'") # Log snippet
 
+# --- Data File Watching ---
+
+_data_file_watcher: Optional[QFileSystemWatcher] = None
+
+def data_file_watcher() -> QFileSystemWatcher:
+    """Returns the shared watcher for Status.data/Responses.data/GeneratedImage.data, creating it on first use."""
+    global _data_file_watcher
+    if _data_file_watcher is None:
+        _data_file_watcher = QFileSystemWatcher([STATUS_DATA_FILE, RESPONSES_DATA_FILE, GENERATED_IMAGE_DATA_FILE])
+        _data_file_watcher.fileChanged.connect(_rewatch_data_file)
+        log.info("Data file watcher created.")
+    return _data_file_watcher
+
+def _rewatch_data_file(path: str):
+    """Re-adds a path dropped by the watcher (files replaced rather than rewritten lose their watch)."""
+    if path not in _data_file_watcher.files() and os.path.exists(path):
+        _data_file_watcher.addPath(path)
+
+# --- Shared Status Model ---
+
+class StatusBroadcaster(QObject):
+    """Reads Status.data once per change and fans the result out to every status label."""
+    status_changed = pyqtSignal(str)
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.last_status: Optional[str] = None
+        backend_bridge.status_changed.connect(self._apply)
+        data_file_watcher().fileChanged.connect(self._on_data_file_changed)
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+        self.timer.start(DATA_POLL_FALLBACK_MS)
+        log.info("Status broadcaster watching Status.data with fallback timer.")
+
+    def _on_data_file_changed(self, path: str):
+        if path == STATUS_DATA_FILE:
+            self.refresh()
+
+    def refresh(self):
+        """Reads the status from Status.data (external writers, fallback timer) and applies it."""
+        try:
+            self._apply(get_assistant_status())
+        except Exception as e:
+            log.error(f"Error in StatusBroadcaster refresh: {e}", exc_info=True)
+
+    @pyqtSlot(str)
+    def _apply(self, status_text: str):
+        """Quits on the exit signal, otherwise emits status_changed only when the status changed."""
+        try:
+            if status_text == "EXIT_REQUESTED":
+                log.info("EXIT_REQUESTED status detected, quitting application.")
+                QApplication.instance().quit() # Gracefully quit the application
+                return
+            if status_text is self.last_status:
+                return # Common case: same shared status object as last time
+            if status_text != self.last_status:
+                self.last_status = status_text
+                self.status_changed.emit(status_text)
+        except Exception as e:
+            log.error(f"Error in StatusBroadcaster _apply: {e}", exc_info=True)
+
+    def connect_status_display(self, slot):
+        """Connects a status slot and immediately hands it the current status."""
+        self.status_changed.connect(slot)
+        if self.last_status is None:
+            self.refresh() # First subscriber: read what is already on disk
+        else:
+            slot(self.last_status)
+
+    def stop_timer(self):
+        """Stops the fallback timer."""
+        if self.timer.isActive():
+            self.timer.stop()
+            log.info("Status broadcaster timer stopped.")
+
+_status_broadcaster: Optional[StatusBroadcaster] = None
+
+def status_broadcaster() -> StatusBroadcaster:
+    """Returns the shared status model, creating it on first use."""
+    global _status_broadcaster
+    if _status_broadcaster is None:
+        _status_broadcaster = StatusBroadcaster()
+    return _status_broadcaster
+
 # --- Text Processing Helpers ---
 
 def answer_modifier(answer: Optional[str]) -> str:
     """Removes empty lines from the answer string."""
     if not answer:
         return ""
-    lines = answer.split('\n')
-    non_empty_lines = [line for line in lines if line.strip()]
-    modified_answer = '\n'.join(non_empty_lines)
-    return modified_answer
+    # A list (not a generator) is what str.join wants; it would build one from a generator anyway
+    return '\n'.join([line for line in answer.splitlines() if line.strip()])
 
+# One compiled pattern does the question-prefix test and finds any trailing punctuation;
+# group 1 is empty when the query has no terminal mark
+_QUESTION_RE = re.compile(
+    r"^(?:how|what|who|where|when|why|which|whose|whom|can you|what's|where's|how's)\s.*?([.?!]?)$",
+    re.DOTALL)
+
+# Pure string -> string, and spoken queries repeat ("what time is it"), so recent ones are memoized
+@lru_cache(maxsize=256)
 def query_modifier(query: Optional[str]) -> str:
     """Formats the query: lowercase, strip, capitalize, add period if question."""
     if not query:
         return ""
     new_query = query.lower().strip()
-    query_words = new_query.split()
-    question_words = ["how", "what", "who", "where", "when", "why", "which", "whose", "whom", "can you", "what's", "where's", "how's"]
-
-    is_question = any(new_query.startswith(word + " ") for word in question_words)
 
-    if is_question:
-        if query_words and query_words[-1][-1] in ['.', '?', '!']:
-            new_query = new_query[:-1] + "."
-        elif not new_query.endswith('.'):
-            new_query += "."
+    match = _QUESTION_RE.match(new_query)
+    if match:
+        new_query = new_query[:match.start(1)] + "."
 
     # Capitalize the first letter
     if new_query:
@@ -223,11 +527,150 @@ def query_modifier(query: Optional[str]) -> str:
 # --- Path Helpers ---
 
 def graphics_directory_path(filename: str) -> str:
-    """Returns the correct path for a graphics file using resource_path."""
-    return resource_path(os.path.join(GRAPHICS_DIR, filename))
+    """Returns the correct path for a graphics file (under the resource_path graphics directory)."""
+    return os.path.join(GRAPHICS_DIR_PATH, filename)
 
 # TempDirectoryPath is now the global TEMP_DIR_PATH
 
+# --- Pixmap and Icon Cache ---
+
+MIC_ICON_SIZE = 55 # Size to display the mic icon within its label
+NAV_ICON_SIZE = 22 # Top bar Home/Chat icons
+CONTROL_ICON_SIZE = 18 # Top bar minimize/maximize/close icons
+IMAGE_CLOSE_ICON_SIZE = 16 # Close button on the generated image panel
+# QSize wrappers built once and shared by every setIconSize call
+NAV_ICON_QSIZE = QSize(NAV_ICON_SIZE, NAV_ICON_SIZE)
+CONTROL_ICON_QSIZE = QSize(CONTROL_ICON_SIZE, CONTROL_ICON_SIZE)
+IMAGE_CLOSE_ICON_QSIZE = QSize(IMAGE_CLOSE_ICON_SIZE, IMAGE_CLOSE_ICON_SIZE)
+
+# Pixmaps keyed by (path, size), size 0 being the unscaled source; each file is decoded
+# once and SmoothTransformation is only paid once per key
+_pixmap_cache: dict[Tuple[str, int], QPixmap] = {}
+
+def load_scaled_pixmap(path: str, size: int) -> QPixmap:
+    """Loads an image scaled to fit size x size (0 = unscaled), once per (path, size). Null if loading fails."""
+    key = (path, size)
+    pixmap = _pixmap_cache.get(key)
+    if pixmap is None:
+        if size == 0:
+            pixmap = QPixmap(path)
+        else:
+            raw = load_scaled_pixmap(path, 0)
+            pixmap = raw if raw.isNull() else raw.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        _pixmap_cache[key] = pixmap
+    return pixmap
+
+# QIcons keyed by (graphics filename, display sizes); buttons sharing an image share one icon
+_icon_cache: dict[Tuple[str, Tuple[int, ...]], QIcon] = {}
+
+def cached_icon(filename: str, *sizes: int) -> QIcon:
+    """Returns the QIcon for a file in the graphics directory, building it on first use.
+
+    Each size in sizes gets pre-scaled pixmaps at 1x and 2x (AA_UseHighDpiPixmaps asks for
+    size * devicePixelRatio), so painting at that size needs no resampling on common
+    displays; the source pixmap is kept too for any other size.
+    """
+    key = (filename, sizes)
+    icon = _icon_cache.get(key)
+    if icon is None:
+        path = graphics_directory_path(filename)
+        source = load_scaled_pixmap(path, 0)
+        icon = QIcon()
+        if not source.isNull():
+            for size in sizes:
+                icon.addPixmap(load_scaled_pixmap(path, size))
+                icon.addPixmap(load_scaled_pixmap(path, size * 2))
+            icon.addPixmap(source)
+        _icon_cache[key] = icon
+    return icon
+
+# Graphics decoded while the main window is built
+_STARTUP_GRAPHICS = ("Home.png", "Chats.png", "Minimize2.png", "Maximize.png", "Restore.png",
+                     "Close.png", "app_icon.png", "Mic_on.png", "Mic_off.png", "Jarvis.gif")
+
+def _warm_graphics_files(filenames: Tuple[str, ...]):
+    """Reads each file once so the GUI thread's later loads hit the OS page cache, not the disk."""
+    for filename in filenames:
+        try:
+            with open(graphics_directory_path(filename), 'rb') as file:
+                file.read()
+        except OSError:
+            pass # Missing files are reported by the widget that loads them
+
+# --- Background Image Loading ---
+
+class ImageLoadSignals(QObject):
+    """Carries results of ImageLoadTask back to the GUI thread (QRunnable itself cannot emit)."""
+    loaded = pyqtSignal(str, QImage, QImage) # (image path, source, scaled); null if decoding failed
+
+class ImageLoadTask(QRunnable):
+    """Decodes (unless a decoded source is given) and smooth-scales an image on a QThreadPool thread.
+
+    Works on QImage only, since QPixmap must not be used outside the GUI thread; the
+    receiving slot converts the result with QPixmap.fromImage.
+    """
+    def __init__(self, path: str, width: int, signals: ImageLoadSignals, source: Optional[QImage] = None):
+        super().__init__()
+        self.path = path
+        self.width = width
+        self.signals = signals
+        self.source = source
+
+    def run(self):
+        source = self.source
+        scaled = QImage()
+        try:
+            if source is None:
+                source = QImage()
+                source.load(self.path)
+            if not source.isNull():
+                scaled = source.scaledToWidth(self.width, Qt.SmoothTransformation)
+                # Convert here rather than in every paint: opaque images blit as RGB32,
+                # transparent ones as premultiplied ARGB (what QPainter blends natively)
+                fmt = QImage.Format_ARGB32_Premultiplied if scaled.hasAlphaChannel() else QImage.Format_RGB32
+                if scaled.format() != fmt:
+                    scaled = scaled.convertToFormat(fmt)
+        except Exception as e:
+            log.error(f"Error decoding image {self.path}: {e}", exc_info=True)
+            source = scaled = QImage()
+        self.signals.loaded.emit(self.path, source, scaled)
+
+# --- Screen Helpers ---
+
+_available_geometry: Optional[QRect] = None
+
+def available_screen_geometry() -> Optional[QRect]:
+    """Returns the primary screen's available geometry (docks/taskbars excluded), or None.
+
+    Looked up once; InitialScreen and MainWindow both size themselves from it at startup.
+    """
+    global _available_geometry
+    if _available_geometry is None:
+        # screenAt covers a missing primary screen without building the screens() list
+        screen = QApplication.primaryScreen() or QApplication.screenAt(QPoint(0, 0))
+        if screen is None:
+            log.error("No screens detected by QApplication.")
+            return None
+        _available_geometry = screen.availableGeometry()
+        log.info(f"Detected available screen geometry: {_available_geometry.width()}x{_available_geometry.height()} "
+                 f"at ({_available_geometry.x()},{_available_geometry.y()})")
+    return _available_geometry
+
+# --- Animation Helpers ---
+
+def set_movie_paused(movie: Optional[QMovie], paused: bool):
+    """Pauses or resumes a valid QMovie, starting it if it has never run."""
+    if movie is None or not movie.isValid():
+        return
+    state = movie.state()
+    if paused:
+        if state == QMovie.Running:
+            movie.setPaused(True)
+    elif state == QMovie.Paused:
+        movie.setPaused(False)
+    elif state == QMovie.NotRunning:
+        movie.start()
+
 # --- Mic Button Actions ---
 
 def mic_button_initialed():
@@ -249,8 +692,9 @@ class ChatSection(QWidget):
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
         log.info("Initializing ChatSection...")
-        self._last_displayed_message = "" # Internal state for comparison
-        self._last_status = "" # Internal state for status comparison
+        self._last_displayed_hash = hash("") # Hash of the last Responses.data content handled
+        self._last_responses_stat: Tuple[int, int] = (0, -1) # (st_mtime_ns, st_size) of the last poll
+        self._pending_messages: list[str] = [] # Messages waiting for the next batched insert
         self._setup_ui()
         self._setup_timer()
         log.info("ChatSection initialization complete.")
@@ -261,18 +705,28 @@ class ChatSection(QWidget):
         layout.setContentsMargins(15, 15, 15, 15)
         layout.setSpacing(10)
 
-        self.chat_text_edit = QTextEdit()
+        # Append-only log: QPlainTextEdit lays out per block instead of re-laying out the whole document
+        self.chat_text_edit = QPlainTextEdit()
         self.chat_text_edit.setReadOnly(True)
         self.chat_text_edit.setTextInteractionFlags(Qt.TextSelectableByMouse | Qt.TextSelectableByKeyboard)
         self.chat_text_edit.setFrameStyle(QFrame.NoFrame)
+        self.chat_text_edit.setMaximumBlockCount(CHAT_MAX_BLOCKS)
         font = QFont("Segoe UI", 14) # Adjusted font size slightly intial 11
         self.chat_text_edit.setFont(font)
 
+        # Message formats are constant, so build them once and reuse for every insert
+        self._block_format = QTextBlockFormat()
+        self._block_format.setTopMargin(5)    # Spacing above the block
+        self._block_format.setBottomMargin(5) # Spacing below the block
+        self._block_format.setLeftMargin(10)  # Indentation/Padding
+        self._block_format.setRightMargin(10) # Padding
+        self._char_formats: dict[str, QTextCharFormat] = {}
+
         bottom_layout = QHBoxLayout()
         bottom_layout.setContentsMargins(0, 10, 0, 0)
         bottom_layout.setSpacing(15)
 
-        self.status_label = QLabel("Status: Initializing...")
+        self.status_label = QLabel(INITIAL_STATUS_TEXT)
         self.status_label.setStyleSheet("color: #aaaaaa; font-size: 10pt; border: none; background-color: transparent;")
         self.status_label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
         self.status_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
@@ -280,7 +734,7 @@ class ChatSection(QWidget):
         self.gif_label = QLabel()
         self.gif_label.setStyleSheet("border: none; background-color: transparent;")
         self.movie = None
-        self._load_gif()
+        self._gif_requested = False # _load_gif runs the first time the label is actually shown
 
         self.gif_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
         bottom_layout.addWidget(self.status_label)
@@ -291,7 +745,7 @@ class ChatSection(QWidget):
 
         self.setStyleSheet("background-color: #121212;")
         self.chat_text_edit.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 background-color: #1e1e1e; color: #f0f0f0; border: none; padding: 10px;
                 font-family: "Segoe UI", sans-serif;
             }
@@ -326,9 +780,7 @@ class ChatSection(QWidget):
                 self.movie.setScaledSize(scaled_target_size)
                 self.gif_label.setMovie(self.movie)
                 self.gif_label.setFixedSize(scaled_target_size) # Use fixed size for layout stability
-                self.movie.start()
-                if self.movie.state() != QMovie.Running:
-                     log.warning(f"ChatSection: Movie did not start correctly! Path: {gif_path}, Error: {self.movie.lastErrorString()}")
+                # Playback is started from showEvent, and only if the label is actually laid out
             else:
                 self.gif_label.setText("(GIF Error)")
                 log.error(f"ChatSection: QMovie is invalid after creation. Path: {gif_path}, Error: {self.movie.lastErrorString()}")
@@ -338,102 +790,149 @@ class ChatSection(QWidget):
             log.error(f"ChatSection: EXCEPTION during GIF loading: {e}", exc_info=True)
 
     def _setup_timer(self):
-        """Sets up the QTimer for polling updates."""
+        """Subscribes to data file changes, with a slow QTimer as a fallback."""
+        backend_bridge.connect_responses(self._on_response_appended, self._on_responses_appended)
+        data_file_watcher().fileChanged.connect(self._on_data_file_changed)
+        status_broadcaster().connect_status_display(self.update_status_display)
         self.timer = QTimer(self)
-        # Connect timer to polling methods
-        self.timer.timeout.connect(self._check_for_updates)
-        self.timer.start(300) # Check slightly less frequently (adjust as needed)
-        log.info("ChatSection timer started.")
-
-    def _check_for_updates(self):
-        """Called by the timer to poll for messages and status."""
-        self._poll_messages()
-        self._poll_status()
+        self.timer.timeout.connect(self._poll_messages)
+        self.timer.start(DATA_POLL_FALLBACK_MS)
+        self._poll_messages() # Pick up whatever is already on disk
+        log.info("ChatSection file watcher connected and fallback timer started.")
+
+    def _on_data_file_changed(self, path: str):
+        """Reloads messages when Responses.data changes (status comes from the broadcaster)."""
+        if path == RESPONSES_DATA_FILE:
+            self._poll_messages()
+
+    @pyqtSlot(str)
+    def _on_response_appended(self, text: str):
+        """Shows a response sent through backend_bridge."""
+        self._last_displayed_hash = hash(text)
+        cleaned_message = answer_modifier(text)
+        if cleaned_message:
+            self._queue_message(cleaned_message)
+
+    @pyqtSlot(list)
+    def _on_responses_appended(self, texts: list):
+        """Shows a batch of responses sent through backend_bridge."""
+        for text in texts:
+            self._on_response_appended(text)
 
     def _poll_messages(self):
-        """Loads messages from Responses.data and updates the chat display if changed."""
-        # global old_chat_message # Access global (consider removing global later)
+        """Loads messages written to Responses.data by other processes and shows them if changed."""
         try:
+            # Idle ticks cost a single stat: bail out if the file hasn't been touched
+            try:
+                st = os.stat(RESPONSES_DATA_FILE)
+                stat_key = (st.st_mtime_ns, st.st_size)
+            except FileNotFoundError:
+                stat_key = (0, -1)
+            if stat_key == self._last_responses_stat and stat_key[0]:
+                return
+            self._last_responses_stat = stat_key
+            if stat_key == _own_write_stats.get(RESPONSES_DATA_FILE):
+                return # Written by show_text_to_screen; already delivered by backend_bridge
+
             messages = _safe_file_read(RESPONSES_DATA_FILE)
+            if messages is None:
+                return
 
-            # Check if content exists and is different from the last displayed one
-            if messages is not None and messages != self._last_displayed_message:
-                log.debug("ChatSection: Detected change in Responses.data")
-                cleaned_message = answer_modifier(messages)
-                if cleaned_message:
-                    self.add_message(message=cleaned_message, color='#f0f0f0')
+            # Compare hashes rather than holding on to (and re-comparing) the full previous text
+            messages_hash = hash(messages)
+            if messages_hash != self._last_displayed_hash:
+                if messages:
+                    log.debug("ChatSection: Detected change in Responses.data")
+                    cleaned_message = answer_modifier(messages)
+                    if cleaned_message:
+                        self._queue_message(cleaned_message)
+                else:
+                    # Handle external clearing of the file
+                    log.info("ChatSection: Responses.data appears cleared externally.")
                 # Update internal state regardless of whether cleaned message is empty
-                self._last_displayed_message = messages
-            elif messages == "" and self._last_displayed_message != "":
-                # Handle external clearing of the file
-                log.info("ChatSection: Responses.data appears cleared externally.")
-                self._last_displayed_message = messages # Update internal state
+                self._last_displayed_hash = messages_hash
 
         except Exception as e:
             log.error(f"Error in ChatSection _poll_messages: {e}", exc_info=True)
 
-    def _poll_status(self):
-        """Updates the status label AND checks for exit signal."""
-        try:
-            status_text = get_assistant_status()
-
-            # *** CHECK FOR EXIT SIGNAL ***
-            if status_text == "EXIT_REQUESTED":
-                log.info("ChatSection: EXIT_REQUESTED status detected, quitting application.")
-                QApplication.instance().quit() # Gracefully quit the application
-                return # Stop further processing here
-
-            # Update label only if status changed
-            if status_text != self._last_status:
-                display_text = f"Status: {status_text or 'Idle'}"
-                self.status_label.setText(display_text)
-                self._last_status = status_text # Update internal state
-                # log.debug(f"ChatSection: Status updated to: {status_text}") # Can be noisy
-
-        except Exception as e:
-            log.error(f"Error in ChatSection _poll_status: {e}", exc_info=True)
-
     # --- Public Methods / Slots (for future signal connection) ---
     # @pyqtSlot(str)
     def update_status_display(self, status: str):
          """Updates the status label directly (intended for signal connection)."""
-         display_text = f"Status: {status or 'Idle'}"
-         self.status_label.setText(display_text)
-         self._last_status = status # Keep internal state consistent
+         self.status_label.setText(status_label_text(status))
 
     # @pyqtSlot(str)
-    def add_message(self, message: str, color: str = '#f0f0f0'):
-        """Adds a formatted message to the chat display."""
-        try:
-            cursor = self.chat_text_edit.textCursor()
-            cursor.movePosition(QTextCursor.End)
-
-            is_empty_doc = self.chat_text_edit.document().isEmpty()
-            if not is_empty_doc:
-                 # Insert a new block (paragraph) for separation only if not the first message
-                 cursor.insertBlock()
-
+    def _char_format(self, color: str) -> QTextCharFormat:
+        """Returns the shared character format for a text colour, building it on first use."""
+        char_format = self._char_formats.get(color)
+        if char_format is None:
             char_format = QTextCharFormat()
             char_format.setForeground(QColor(color))
-            # Use the font already set on the QTextEdit
-            # font = QFont(); font.setPointSize(11); char_format.setFont(font)
+            # Use the font already set on the text view
             char_format.setFont(self.chat_text_edit.font())
+            self._char_formats[color] = char_format
+        return char_format
 
-            block_format = QTextBlockFormat()
-            block_format.setTopMargin(5)    # Spacing above the block
-            block_format.setBottomMargin(5) # Spacing below the block
-            block_format.setLeftMargin(10)  # Indentation/Padding
-            block_format.setRightMargin(10) # Padding
+    def add_message(self, message: str, color: str = '#f0f0f0'):
+        """Adds a formatted message to the chat display."""
+        self.add_messages([message], color)
 
-            cursor.setBlockFormat(block_format) # Apply block formatting first
-            cursor.setCharFormat(char_format)   # Then apply character formatting
-            cursor.insertText(message)          # Insert the text
+    def add_messages(self, messages: list[str], color: str = '#f0f0f0'):
+        """Adds several formatted messages in one edit block, so Qt lays out and scrolls once."""
+        if not messages:
+            return
+        try:
+            cursor = self.chat_text_edit.textCursor()
+            cursor.movePosition(QTextCursor.End)
+            cursor.beginEditBlock()
+            char_format = self._char_format(color)
+            if self.chat_text_edit.document().isEmpty():
+                # First message goes into the existing empty block, so format that block once
+                cursor.setBlockFormat(self._block_format)
+                first_in_document = True
+            else:
+                first_in_document = False
+            for message in messages:
+                if len(message) > CHAT_MAX_MESSAGE_CHARS:
+                    message = message[:CHAT_MAX_MESSAGE_CHARS] + "…"
+                if first_in_document:
+                    first_in_document = False
+                else:
+                    # New block (paragraph) with both formats applied in the same call
+                    cursor.insertBlock(self._block_format, char_format)
+                cursor.insertText(message, char_format)
+            cursor.endEditBlock()
 
             # Ensure the new message is visible
             self.chat_text_edit.ensureCursorVisible()
-            log.debug(f"ChatSection: Added message: '{message[:50]}...'")
+            log.debug("ChatSection: Added %d message(s), last: '%.50s...'", len(messages), messages[-1])
         except Exception as e:
-            log.error(f"Error in ChatSection add_message: {e}", exc_info=True)
+            log.error(f"Error in ChatSection add_messages: {e}", exc_info=True)
+
+    def _queue_message(self, message: str):
+        """Queues a message and flushes the queue once control returns to the event loop."""
+        self._pending_messages.append(message)
+        if len(self._pending_messages) == 1:
+            QTimer.singleShot(0, self._flush_pending_messages)
+
+    def _flush_pending_messages(self):
+        pending, self._pending_messages = self._pending_messages, []
+        self.add_messages(pending, color='#f0f0f0')
+
+    # --- Visibility: only animate the GIF while it can be seen ---
+    def showEvent(self, event: QEvent):
+        super().showEvent(event)
+        gif_visible = self.gif_label.isVisibleTo(self)
+        if gif_visible and not self._gif_requested:
+            # Decode the GIF only once it can be seen; while the label stays out of the
+            # layout it is never loaded at all
+            self._gif_requested = True
+            self._load_gif()
+        set_movie_paused(self.movie, not gif_visible)
+
+    def hideEvent(self, event: QEvent):
+        super().hideEvent(event)
+        set_movie_paused(self.movie, True)
 
     def stop_timer(self):
         """Stops the internal timer."""
@@ -447,7 +946,13 @@ class InitialScreen(QWidget):
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
         log.info("Initializing InitialScreen...")
-        self._last_status = "" # Internal state for status comparison
+        self._last_mic_on: Optional[bool] = None # Mic state currently shown by the icon
+        self._pending_mic_state: Optional[bool] = None # Clicked state not yet written to Mic.data
+        # Coalesce click bursts so only the final state is written
+        self._mic_debounce = QTimer(self)
+        self._mic_debounce.setSingleShot(True)
+        self._mic_debounce.setInterval(120)
+        self._mic_debounce.timeout.connect(self._commit_mic_state)
         self._setup_ui()
         self._load_mic_icons()
         self._update_mic_icon_visual() # Set initial icon state
@@ -456,22 +961,7 @@ class InitialScreen(QWidget):
 
     def _get_screen_geometry(self) -> QRect:
         """Safely gets the primary screen's available geometry."""
-        try:
-            screen = QApplication.primaryScreen()
-            if not screen:
-                screens = QApplication.screens()
-                if screens:
-                    screen = screens[0]
-                    log.warning("Primary screen not found, using first available screen.")
-                else:
-                    log.error("No screens detected by QApplication.")
-                    return QRect(0, 0, 1024, 768) # Fallback default
-            geometry = screen.availableGeometry() # Use availableGeometry to avoid docks/taskbars
-            log.info(f"Detected available screen geometry: {geometry.width()}x{geometry.height()}")
-            return geometry
-        except Exception as e:
-             log.error(f"Could not get screen geometry: {e}. Using defaults.", exc_info=True)
-             return QRect(0, 0, 1024, 768) # Fallback default
+        return available_screen_geometry() or QRect(0, 0, 1024, 768) # Fallback default
 
     def _setup_ui(self):
         """Creates the UI elements for the initial screen."""
@@ -493,7 +983,7 @@ class InitialScreen(QWidget):
         self.gif_label.setMinimumSize(230, 142) # Minimum size based on aspect ratio 16:9 200 112
 
         # --- Status Label ---
-        self.status_label = QLabel("Status: Initializing...")
+        self.status_label = QLabel(INITIAL_STATUS_TEXT)
         self.status_label.setStyleSheet("color: #cccccc; font-size: 11pt; border: none; background-color: transparent; qproperty-alignment: 'AlignCenter';")
 
         # --- Mic Icon ---
@@ -539,7 +1029,7 @@ class InitialScreen(QWidget):
                     scaled_width = int(max_gif_height * gif_aspect_ratio)
 
                 scaled_size = QSize(scaled_width, scaled_height)
-                log.debug(f"InitialScreen: Scaling GIF to {scaled_width}x{scaled_height}")
+                log.debug("InitialScreen: Scaling GIF to %dx%d", scaled_width, scaled_height)
                 self.initial_movie.setScaledSize(scaled_size)
                 self.gif_label.setMovie(self.initial_movie)
                 self.initial_movie.start()
@@ -554,79 +1044,52 @@ class InitialScreen(QWidget):
             log.error(f"InitialScreen: EXCEPTION during GIF loading: {e}", exc_info=True)
 
     def _load_mic_icons(self):
-        """Loads and scales the microphone icons."""
-        self.mic_on_pixmap: Optional[QPixmap] = None
-        self.mic_off_pixmap: Optional[QPixmap] = None
-        icon_display_size = 55 # Size to display the icon within the label
-
-        try:
-            mic_on_path = graphics_directory_path('Mic_on.png')
-            mic_off_path = graphics_directory_path('Mic_off.png')
-            log.info(f"InitialScreen: Loading mic icons from: {mic_on_path}, {mic_off_path}")
-
-            temp_mic_on = QPixmap(mic_on_path)
-            temp_mic_off = QPixmap(mic_off_path)
-
-            load_success = True
-            if temp_mic_on.isNull():
-                log.error(f"InitialScreen: Failed to load Mic_on.png from {mic_on_path}")
-                load_success = False
-            if temp_mic_off.isNull():
-                log.error(f"InitialScreen: Failed to load Mic_off.png from {mic_off_path}")
-                load_success = False
-
-            if load_success:
-                 self.mic_on_pixmap = temp_mic_on.scaled(icon_display_size, icon_display_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                 self.mic_off_pixmap = temp_mic_off.scaled(icon_display_size, icon_display_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                 log.info("Mic icons loaded and scaled successfully.")
-            else:
-                 raise ValueError("One or both mic icons failed to load properly.")
+        """Resolves the microphone icon paths; pixmaps are loaded on first display."""
+        self._mic_icon_paths = {
+            True: graphics_directory_path('Mic_on.png'),
+            False: graphics_directory_path('Mic_off.png'),
+        }
+        log.info(f"InitialScreen: Mic icons at: {self._mic_icon_paths[True]}, {self._mic_icon_paths[False]}")
 
-        except Exception as e:
-            log.error(f"ERROR loading or scaling mic icons: {e}", exc_info=True)
-            # Fallback: Create colored squares if icons fail
-            fallback_size = icon_display_size
-            self.mic_on_pixmap = QPixmap(fallback_size, fallback_size)
-            self.mic_on_pixmap.fill(QColor("#4CAF50")) # Greenish
-            self.mic_off_pixmap = QPixmap(fallback_size, fallback_size)
-            self.mic_off_pixmap.fill(QColor("#F44336")) # Reddish
-            log.warning("Using fallback colored squares for mic icons.")
+    def _mic_pixmap(self, is_on: bool) -> QPixmap:
+        """Returns the scaled mic icon for a state, or a coloured square if it fails to load."""
+        pixmap = load_scaled_pixmap(self._mic_icon_paths[is_on], MIC_ICON_SIZE)
+        if pixmap.isNull():
+            log.error(f"InitialScreen: Failed to load mic icon from {self._mic_icon_paths[is_on]}, using fallback square.")
+            pixmap = QPixmap(MIC_ICON_SIZE, MIC_ICON_SIZE)
+            pixmap.fill(QColor("#4CAF50" if is_on else "#F44336")) # Greenish / Reddish
+        return pixmap
 
     def _setup_timer(self):
-        """Sets up the QTimer for polling status updates."""
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self._poll_status) # Connect timer
-        self.timer.start(300) # Check status periodically
-        log.info("InitialScreen timer started.")
-
-    def _poll_status(self):
-        """Updates the status label AND checks for exit signal."""
-        try:
-            status_text = get_assistant_status()
-            if status_text == "EXIT_REQUESTED":
-                log.info("InitialScreen: EXIT_REQUESTED status detected, quitting application.")
-                QApplication.instance().quit()
-                return
-
-            # Update label only if status changed
-            if status_text != self._last_status:
-                display_text = f"Status: {status_text or 'Idle'}"
-                self.status_label.setText(display_text)
-                self._last_status = status_text # Update internal state
-                # log.debug(f"InitialScreen: Status updated to: {status_text}") # Can be noisy
-
-        except Exception as e:
-            log.error(f"Error in InitialScreen _poll_status: {e}", exc_info=True)
+        """Subscribes the status label to the shared status model."""
+        status_broadcaster().connect_status_display(self.update_status_display)
+        backend_bridge.mic_changed.connect(self._on_mic_changed)
+        log.info("InitialScreen connected to status broadcaster and backend bridge.")
+
+    @pyqtSlot(bool)
+    def _on_mic_changed(self, is_on: bool):
+        """Refreshes the mic icon when the backend switches the microphone."""
+        if self._pending_mic_state is not None:
+            return # A click is about to be written; it overrides this state
+        self._update_mic_icon_visual(is_on)
 
-    def _update_mic_icon_visual(self):
-        """Updates the mic icon label based on the current status from the file."""
-        is_mic_on = get_microphone_status()
+    # @pyqtSlot(str)
+    def update_status_display(self, status: str):
+        """Updates the status label (connected to StatusBroadcaster.status_changed)."""
+        self.status_label.setText(status_label_text(status))
+
+    def _update_mic_icon_visual(self, is_mic_on: Optional[bool] = None):
+        """Updates the mic icon label, skipping the pixmap/tooltip work if the state is unchanged."""
+        if is_mic_on is None:
+            is_mic_on = get_microphone_status()
+        if is_mic_on == self._last_mic_on:
+            return
+        self._last_mic_on = is_mic_on
+        pixmap = self._mic_pixmap(is_mic_on)
         if is_mic_on:
-            pixmap = self.mic_on_pixmap
             tooltip = "Microphone is ON (Click to turn OFF)"
             fallback_text = "MIC ON"
         else:
-            pixmap = self.mic_off_pixmap
             tooltip = "Microphone is OFF (Click to turn ON)"
             fallback_text = "MIC OFF"
 
@@ -641,23 +1104,36 @@ class InitialScreen(QWidget):
     def _toggle_mic_icon(self, event: QEvent):
         """Handles clicks on the mic icon label."""
         if event.button() == Qt.LeftButton:
-            current_state = get_microphone_status()
+            current_state = self._pending_mic_state
+            if current_state is None:
+                current_state = get_microphone_status()
             new_state = not current_state
             log.info(f"Mic icon clicked. Current state: {current_state}, New state: {new_state}")
-            # Call the appropriate action function to update the data file
-            action = mic_button_closed if new_state else mic_button_initialed
-            action()
-            # Update the visual display immediately
-            self._update_mic_icon_visual()
+            # Update the visual display immediately; the data file is written once clicks settle
+            self._pending_mic_state = new_state
+            self._update_mic_icon_visual(new_state)
+            self._mic_debounce.start()
             event.accept()
         else:
             event.ignore()
 
-    def stop_timer(self):
-        """Stops the internal timer."""
-        if hasattr(self, 'timer') and self.timer.isActive():
-            self.timer.stop()
-            log.info("InitialScreen timer stopped.")
+    def _commit_mic_state(self):
+        """Writes the last clicked mic state, unless the clicks cancelled each other out."""
+        new_state, self._pending_mic_state = self._pending_mic_state, None
+        if new_state is None or new_state == get_microphone_status():
+            return
+        # Call the appropriate action function to update the data file
+        action = mic_button_closed if new_state else mic_button_initialed
+        action()
+
+    # --- Visibility: only animate the GIF while it can be seen ---
+    def showEvent(self, event: QEvent):
+        super().showEvent(event)
+        set_movie_paused(self.initial_movie, False)
+
+    def hideEvent(self, event: QEvent):
+        super().hideEvent(event)
+        set_movie_paused(self.initial_movie, True)
 
 
 class MessageScreen(QWidget):
@@ -666,6 +1142,16 @@ class MessageScreen(QWidget):
         super().__init__(parent)
         log.info("Initializing MessageScreen...")
         self._last_checked_image_path = None # Track the last processed image path
+        self._image_data_stat: Tuple[int, int] = (0, -1) # (st_mtime_ns, st_size) of GeneratedImage.data last check
+        self._image_signals = ImageLoadSignals(self) # Decoded images come back through here
+        self._image_signals.loaded.connect(self._on_image_loaded)
+        self._source_image: Optional[QImage] = None # Decoded image being shown, rescaled on resize
+        self._scaled_width = 0 # Label width the shown pixmap was scaled for
+        # Rescale once a drag-resize settles rather than on every intermediate size
+        self._resize_debounce = QTimer(self)
+        self._resize_debounce.setSingleShot(True)
+        self._resize_debounce.setInterval(80)
+        self._resize_debounce.timeout.connect(self._apply_scaled)
         self._setup_ui()
         self._setup_timer()
         log.info("MessageScreen initialization complete.")
@@ -676,37 +1162,24 @@ class MessageScreen(QWidget):
         layout.setContentsMargins(10, 10, 10, 10) # Slightly reduced margins
         layout.setSpacing(10)
 
-        # --- Chat Section ---
         self.chat_section = ChatSection(self)
         layout.addWidget(self.chat_section, 1) # Chat section takes most vertical space
 
         # --- Image Display Area with Close Button ---
         self.image_container = QFrame(self)
-        self.image_container.setObjectName("ImageContainerFrame")
-        # Style the container - subtle background and border
-        self.image_container.setStyleSheet("""
-            #ImageContainerFrame {
-                background-color: #1A1A1A; /* Slightly different background */
-                border: 1px solid #333333;
-                border-radius: 8px;
-            }
-        """)
+        self.image_container.setObjectName("ImageContainerFrame") # Styled by GLOBAL_STYLESHEET
         image_container_layout = QVBoxLayout(self.image_container)
         image_container_layout.setContentsMargins(5, 5, 5, 5) # Inner padding
         image_container_layout.setSpacing(5)
 
-        # --- Top Bar for Close Button ---
-        top_bar_layout = QHBoxLayout()
-        top_bar_layout.setContentsMargins(0, 0, 0, 0)
-        top_bar_layout.addStretch(1) # Push button to the right
-
+        # --- Close Button ---
         self.image_close_button = QPushButton()
         try:
             close_icon_path = graphics_directory_path('Close.png')
-            close_icon = QIcon(close_icon_path)
+            close_icon = cached_icon('Close.png', IMAGE_CLOSE_ICON_SIZE)
             if not close_icon.isNull():
                 self.image_close_button.setIcon(close_icon)
-                self.image_close_button.setIconSize(QSize(16, 16)) # Smaller icon
+                self.image_close_button.setIconSize(IMAGE_CLOSE_ICON_QSIZE) # Smaller icon
             else:
                 log.warning(f"Failed to load Close.png for image close button, using text 'X'. Path: {close_icon_path}")
                 self.image_close_button.setText("X") # Fallback text
@@ -715,37 +1188,23 @@ class MessageScreen(QWidget):
              log.error(f"Error loading close icon for image: {e}", exc_info=True)
              self.image_close_button.setText("X") # Fallback text
 
-        # Style the close button: small, flat, red hover
+        # Small, flat, red hover (#imageCloseBtn in GLOBAL_STYLESHEET)
+        self.image_close_button.setObjectName("imageCloseBtn")
         self.image_close_button.setFixedSize(24, 24)
         self.image_close_button.setCursor(Qt.PointingHandCursor)
         self.image_close_button.setToolTip("Close Image")
-        self.image_close_button.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: none;
-                color: #AAAAAA; /* Default color for 'X' text */
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #E81123; /* Red hover */
-                color: white; /* White 'X' on hover */
-            }
-            QPushButton:pressed {
-                background-color: #F1707A; /* Lighter red pressed */
-            }
-        """)
         self.image_close_button.clicked.connect(self._hide_image_container) # Connect click
-        top_bar_layout.addWidget(self.image_close_button)
-        image_container_layout.addLayout(top_bar_layout) # Add button bar to container
+        # Right-aligned by the layout item itself; no extra row layout or stretch needed
+        image_container_layout.addWidget(self.image_close_button, 0, Qt.AlignRight)
 
         # --- Image Label ---
         self.image_display_label = QLabel()
+        self.image_display_label.setObjectName("ImageDisplayLabel") # Styled by GLOBAL_STYLESHEET
         self.image_display_label.setAlignment(Qt.AlignCenter)
         # Let the container manage size, but set a reasonable minimum height for the label
         self.image_display_label.setMinimumHeight(150)
         # Allow label to expand horizontally and vertically within its container
         self.image_display_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self.image_display_label.setStyleSheet("border: none; background-color: transparent; color: #888888;")
         self.image_display_label.setText("Generated image will appear here") # Placeholder
         image_container_layout.addWidget(self.image_display_label, 1) # Image label takes remaining space
 
@@ -757,15 +1216,41 @@ class MessageScreen(QWidget):
         self.setStyleSheet("background-color: #121212;") # Background for the screen itself
 
     def _setup_timer(self):
-        """Sets up the QTimer to check for new images."""
+        """Subscribes to GeneratedImage.data changes; the fallback QTimer is started by set_active."""
+        data_file_watcher().fileChanged.connect(self._on_data_file_changed)
         self.image_check_timer = QTimer(self)
+        self.image_check_timer.setInterval(DATA_POLL_FALLBACK_MS)
         self.image_check_timer.timeout.connect(self._check_for_generated_image)
-        self.image_check_timer.start(1000)  # Check every 1 second
-        log.info("MessageScreen image check timer started.")
+
+    def _on_data_file_changed(self, path: str):
+        """Checks for a new image when GeneratedImage.data changes (set_active catches up if hidden)."""
+        if path == GENERATED_IMAGE_DATA_FILE and self.image_check_timer.isActive():
+            self._check_for_generated_image()
+
+    def set_active(self, active: bool):
+        """Polls for generated images only while this page is the current one."""
+        if active:
+            if not self.image_check_timer.isActive():
+                self._check_for_generated_image() # Catch up on anything written while hidden
+                self.image_check_timer.start()
+                log.debug("MessageScreen image check timer started.")
+        elif self.image_check_timer.isActive():
+            self.image_check_timer.stop()
+            log.debug("MessageScreen image check timer paused while page is hidden.")
 
     def _check_for_generated_image(self):
         """Checks GeneratedImage.data for a new image path and displays it."""
         try:
+            # Unchanged data file: a single stat and nothing else
+            try:
+                st = os.stat(GENERATED_IMAGE_DATA_FILE)
+                stat_key = (st.st_mtime_ns, st.st_size)
+            except FileNotFoundError:
+                stat_key = (0, -1)
+            if stat_key == self._image_data_stat and stat_key[0]:
+                return
+            self._image_data_stat = stat_key
+
             # Read the image path from the status file
             image_path = _safe_file_read(GENERATED_IMAGE_DATA_FILE)
 
@@ -786,8 +1271,10 @@ class MessageScreen(QWidget):
             log.info(f"Detected new image path in data file: '{image_path}'")
             self._last_checked_image_path = image_path # Store the path we are now processing
 
-            # 3. Check if the image file itself exists
-            if not os.path.exists(image_path):
+            # 3. Check if the image file itself exists (EAFP: one stat, no separate exists() call)
+            try:
+                os.stat(image_path)
+            except OSError:
                  log.warning(f"Image path found ('{image_path}'), but file does not exist at that location.")
                  # Optionally clear the data file if path is invalid? Or let the backend handle it.
                  # _safe_file_write(GENERATED_IMAGE_DATA_FILE, "") # Clear if invalid
@@ -796,38 +1283,10 @@ class MessageScreen(QWidget):
                  return # Stop processing this path
 
             # --- Load and Display the Image ---
-            log.info(f"Loading image from path: {image_path}")
-            pixmap = QPixmap(image_path)
-
-            if not pixmap.isNull():
-                log.info("Pixmap loaded successfully.")
-                # Scale the pixmap to fit the container width, respecting aspect ratio
-                # Use the image_display_label's current width as a guide, but provide a fallback
-                container_width = self.image_display_label.width()
-                if container_width <= 10: container_width = 600 # Use a sensible default if layout hasn't updated yet
-                # Scale to width, height will adjust automatically with KeepAspectRatio
-                scaled_pixmap = pixmap.scaledToWidth(container_width, Qt.SmoothTransformation)
-
-                self.image_display_label.setPixmap(scaled_pixmap)
-                self.image_container.setVisible(True) # Make the container visible
-                # Adjust container height dynamically if needed (optional)
-                # self.image_container.setFixedHeight(scaled_pixmap.height() + 40) # + padding/button space
-                log.info(f"Image displayed. Original: {pixmap.width()}x{pixmap.height()}, Scaled width: {scaled_pixmap.width()}")
-
-                # Clear the status file ONLY AFTER successfully loading and displaying?
-                # Or maybe the backend should clear it after writing?
-                # For now, let's assume the backend manages clearing it or overwriting it.
-                # If you want the GUI to clear it:
-                # _safe_file_write(GENERATED_IMAGE_DATA_FILE, "")
-                # log.info(f"Cleared image data file: {GENERATED_IMAGE_DATA_FILE}")
-
-            else:
-                # Pixmap is null - the file might not be a valid image format
-                log.error(f"Failed to load QPixmap from path: {image_path}. Is it a valid image file?")
-                self.image_display_label.setText("Error loading image") # Show error in label
-                self.image_container.setVisible(True) # Show container with error
-                # Optionally clear the data file even on load error
-                # _safe_file_write(GENERATED_IMAGE_DATA_FILE, "")
+            # Decode + scale on the thread pool so a large image doesn't stall the event loop
+            log.debug("Loading image from path: %s", image_path)
+            self._source_image = None
+            self._start_image_task(image_path)
 
         except IOError as e:
              log.error(f"IOError accessing generated image data file: {e}", exc_info=True)
@@ -837,8 +1296,48 @@ class MessageScreen(QWidget):
             # self.image_display_label.setText("Error processing image")
             # self.image_container.setVisible(True)
 
+    def _start_image_task(self, image_path: str, source: Optional[QImage] = None):
+        """Queues decoding (if no source is given) and scaling to the label's current width."""
+        container_width = self.image_display_label.width()
+        if container_width <= 10: container_width = 600 # Use a sensible default if layout hasn't updated yet
+        self._scaled_width = container_width
+        QThreadPool.globalInstance().start(ImageLoadTask(image_path, container_width, self._image_signals, source))
+
+    @pyqtSlot(str, QImage, QImage)
+    def _on_image_loaded(self, image_path: str, source: QImage, image: QImage):
+        """Displays an image decoded by ImageLoadTask, unless a newer path has replaced it."""
+        if image_path != self._last_checked_image_path:
+            log.debug(f"Dropping stale image load result for: {image_path}")
+            return
+        if not image.isNull():
+            self._source_image = source
+            scaled_pixmap = QPixmap.fromImage(image)
+            self.image_display_label.setPixmap(scaled_pixmap)
+            self.image_container.setVisible(True) # Make the container visible
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Image displayed. Scaled size: %dx%d", scaled_pixmap.width(), scaled_pixmap.height())
+        else:
+            # Image is null - the file might not be a valid image format
+            log.error(f"Failed to load image from path: {image_path}. Is it a valid image file?")
+            self.image_display_label.setText("Error loading image") # Show error in label
+            self.image_container.setVisible(True) # Show container with error
+
+    def resizeEvent(self, event: QEvent):
+        super().resizeEvent(event)
+        if self._source_image is not None:
+            self._resize_debounce.start() # Restarts the countdown on every resize step
+
+    def _apply_scaled(self):
+        """Rescales the shown image from its decoded source once the label width has changed."""
+        if self._source_image is None or not self.image_container.isVisible():
+            return
+        if self.image_display_label.width() == self._scaled_width:
+            return
+        self._start_image_task(self._last_checked_image_path, self._source_image)
+
     def _hide_image_container(self):
         """Hides the image container and clears the pixmap."""
+        self._source_image = None # Nothing to rescale while hidden
         if self.image_container.isVisible():
             self.image_container.setVisible(False)
             self.image_display_label.clear() # Clear the pixmap
@@ -854,18 +1353,21 @@ class MessageScreen(QWidget):
         if hasattr(self, 'image_check_timer') and self.image_check_timer.isActive():
             self.image_check_timer.stop()
             log.info("MessageScreen image check timer stopped.")
-        if hasattr(self, 'chat_section'):
-            self.chat_section.stop_timer() # Delegate stopping chat timer
+        self.chat_section.stop_timer() # Delegate stopping chat timer
 
 
 class CustomTopBar(QWidget):
     """Custom top bar with title, navigation, and window controls."""
+    BACKGROUND_COLOR = QColor("#252525") # Slightly lighter than the window background
+    BORDER_COLOR = QColor("#383838")
+
     def __init__(self, parent_window: QMainWindow, stacked_widget: QStackedWidget):
         super().__init__(parent_window)
         log.info("Initializing CustomTopBar...")
         self.parent_window = parent_window
         self.stacked_widget = stacked_widget
         self.offset: Optional[QPoint] = None # For window dragging
+        self._last_max_state: Optional[bool] = None # Maximized state the button currently shows
         self._setup_ui()
         # Update maximize icon state after UI is built and window is shown
         QTimer.singleShot(100, self._update_maximize_button_icon) # Short delay
@@ -874,71 +1376,28 @@ class CustomTopBar(QWidget):
     def _setup_ui(self):
         """Creates the UI elements for the top bar."""
         self.setFixedHeight(50) # Fixed height for the top bar
-        self.setStyleSheet("""
-            QWidget { background-color: #252525; border-bottom: 1px solid #383838; }
-        """) # Slightly lighter background
+        self.setObjectName("topBar")
+        # paintEvent fills every pixel, so Qt can skip erasing the region underneath first
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
+        self.setAutoFillBackground(False)
         layout = QHBoxLayout(self)
         layout.setContentsMargins(15, 0, 10, 0) # Left, Top, Right, Bottom margins
         layout.setSpacing(10)
 
         # --- Title ---
-        ASSISTANT_NAME = "NOVA" # Placeholder for the assistant name
-        title_label = QLabel(f" {ASSISTANT_NAME.capitalize()}")
-        title_label.setStyleSheet("""
-            QLabel {
-                color: #66bbff; /* Lighter blue */
-                font-size: 14pt; /* Use points for font size */
-                font-weight: bold;
-                padding-left: 5px;
-                background-color: transparent;
-                border: none;
-            }
-        """)
+        title_label = QLabel(TOP_BAR_TITLE)
+        title_label.setObjectName("topBarTitle")
 
         # --- Navigation Buttons ---
-        nav_button_style = """
-            QPushButton {
-                background-color: transparent;
-                color: #e0e0e0; /* Lighter text */
-                border: none;
-                padding: 5px 10px; /* Adjust padding */
-                border-radius: 5px;
-                font-size: 10pt;
-                min-height: 32px; /* Adjust height */
-                text-align: left;
-            }
-            QPushButton:hover { background-color: #3a3a3a; }
-            QPushButton:pressed { background-color: #484848; }
-            QPushButton:focus { outline: none; }
-        """
-        nav_icon_size = QSize(22, 22) # Slightly smaller icons
-
-        home_button = self._create_nav_button(" Home", "Home.png", 0, nav_icon_size, nav_button_style)
-        message_button = self._create_nav_button(" Chat", "Chats.png", 1, nav_icon_size, nav_button_style)
+        home_button = self._create_nav_button(" Home", "Home.png", self._go_home)
+        message_button = self._create_nav_button(" Chat", "Chats.png", self._go_chat)
 
         # --- Window Control Buttons ---
-        control_button_style = """
-            QPushButton {
-                background-color: transparent;
-                border: none;
-                padding: 0px;
-                border-radius: 5px;
-                min-width: 38px; max-width: 38px; /* Slightly wider */
-                min-height: 32px; max-height: 32px; /* Match nav buttons */
-            }
-            QPushButton:hover { background-color: #444444; }
-            QPushButton:pressed { background-color: #555555; }
-            QPushButton:focus { outline: none; }
-        """
-        control_icon_size = QSize(18, 18) # Smaller control icons
-
-        minimize_button = self._create_control_button('Minimize2.png', self._minimize_window, "Minimize", control_icon_size, control_button_style)
-        self.maximize_button = self._create_control_button(None, self._toggle_maximize_window, "Maximize", control_icon_size, control_button_style) # Icon set later
-        close_button = self._create_control_button('Close.png', self._close_window, "Close", control_icon_size, control_button_style)
-        # Special hover/pressed style for close button
-        close_button.setStyleSheet(control_button_style +
-            " QPushButton:hover { background-color: #E81123; }"
-            " QPushButton:pressed { background-color: #F1707A; }")
+        minimize_button = self._create_control_button('Minimize2.png', self._minimize_window, "Minimize")
+        self.maximize_button = self._create_control_button(None, self._toggle_maximize_window, "Maximize") # Icon set later
+        # The close button gets its own object name for the red hover/pressed style
+        close_button = self._create_control_button('Close.png', self._close_window, "Close", "closeBtn")
 
         # Load maximize/restore icons separately
         self._load_maximize_restore_icons()
@@ -954,12 +1413,13 @@ class CustomTopBar(QWidget):
         layout.addWidget(self.maximize_button)
         layout.addWidget(close_button)
 
-    def _create_nav_button(self, text: str, icon_filename: str, index: int, icon_size: QSize, style: str) -> QPushButton:
-        """Helper to create navigation buttons."""
+    def _create_nav_button(self, text: str, icon_filename: str, slot) -> QPushButton:
+        """Helper to create navigation buttons (styled by #navBtn in the global stylesheet)."""
         button = QPushButton(text)
+        button.setObjectName("navBtn")
         try:
             icon_path = graphics_directory_path(icon_filename)
-            icon = QIcon(icon_path)
+            icon = cached_icon(icon_filename, NAV_ICON_SIZE)
             if icon.isNull():
                 log.warning(f"Failed to load navigation icon: {icon_filename}. Path: {icon_path}")
             else:
@@ -967,19 +1427,20 @@ class CustomTopBar(QWidget):
         except Exception as e:
             log.error(f"Error loading navigation icon '{icon_filename}': {e}", exc_info=True)
 
-        button.setIconSize(icon_size)
-        button.setStyleSheet(style)
+        button.setIconSize(NAV_ICON_QSIZE)
         button.setCursor(Qt.PointingHandCursor)
-        button.clicked.connect(lambda: self.stacked_widget.setCurrentIndex(index))
+        button.clicked.connect(slot)
         return button
 
-    def _create_control_button(self, icon_filename: Optional[str], slot, tooltip: str, icon_size: QSize, style: str) -> QPushButton:
-        """Helper to create window control buttons."""
+    def _create_control_button(self, icon_filename: Optional[str], slot, tooltip: str,
+                               object_name: str = "ctrlBtn") -> QPushButton:
+        """Helper to create window control buttons (styled by object name in the global stylesheet)."""
         button = QPushButton()
+        button.setObjectName(object_name)
         if icon_filename:
             try:
                 icon_path = graphics_directory_path(icon_filename)
-                icon = QIcon(icon_path)
+                icon = cached_icon(icon_filename, CONTROL_ICON_SIZE)
                 if icon.isNull():
                     log.warning(f"Failed to load control icon: {icon_filename}. Path: {icon_path}")
                     button.setText(tooltip[0]) # Fallback: First letter
@@ -989,8 +1450,7 @@ class CustomTopBar(QWidget):
                 log.error(f"Error loading control icon '{icon_filename}': {e}", exc_info=True)
                 button.setText(tooltip[0]) # Fallback
 
-        button.setIconSize(icon_size)
-        button.setStyleSheet(style)
+        button.setIconSize(CONTROL_ICON_QSIZE)
         button.setToolTip(tooltip)
         button.setCursor(Qt.PointingHandCursor)
         button.clicked.connect(slot)
@@ -1005,8 +1465,8 @@ class CustomTopBar(QWidget):
             res_icon_path = graphics_directory_path('Restore.png')
             log.info(f"TopBar: Loading Max/Res icons from: {max_icon_path}, {res_icon_path}")
 
-            temp_max_icon = QIcon(max_icon_path)
-            temp_res_icon = QIcon(res_icon_path)
+            temp_max_icon = cached_icon('Maximize.png', CONTROL_ICON_SIZE)
+            temp_res_icon = cached_icon('Restore.png', CONTROL_ICON_SIZE)
 
             if temp_max_icon.isNull(): log.warning(f"Failed to load Maximize.png from {max_icon_path}")
             else: self.maximize_icon = temp_max_icon
@@ -1017,10 +1477,15 @@ class CustomTopBar(QWidget):
         except Exception as e:
             log.error(f"Error loading Maximize/Restore icons: {e}", exc_info=True)
 
+    @pyqtSlot()
     def _update_maximize_button_icon(self):
         """Sets the correct icon (Maximize/Restore) and tooltip based on window state."""
         if not self.parent_window: return
-        if self.parent_window.isMaximized():
+        maximized = self.parent_window.isMaximized()
+        if maximized == self._last_max_state:
+            return # Button already matches; skip the setIcon repolish/repaint
+        self._last_max_state = maximized
+        if maximized:
             icon = self.restore_icon
             tooltip = "Restore Down"
             fallback = "[-]"
@@ -1036,10 +1501,22 @@ class CustomTopBar(QWidget):
              log.warning(f"{tooltip} icon invalid or failed to load. Using text '{fallback}'.")
         self.maximize_button.setToolTip(tooltip)
 
+    # --- Navigation Slots ---
+    @pyqtSlot()
+    def _go_home(self):
+        self.stacked_widget.setCurrentIndex(0)
+
+    @pyqtSlot()
+    def _go_chat(self):
+        self.parent_window.ensure_message_screen()
+        self.stacked_widget.setCurrentIndex(1)
+
     # --- Window Control Slots ---
+    @pyqtSlot()
     def _minimize_window(self):
         if self.parent_window: self.parent_window.showMinimized()
 
+    @pyqtSlot()
     def _toggle_maximize_window(self):
         if not self.parent_window: return
         if self.parent_window.isMaximized():
@@ -1048,9 +1525,16 @@ class CustomTopBar(QWidget):
             self.parent_window.showMaximized()
         # Icon update is handled by the changeEvent in MainWindow
 
+    @pyqtSlot()
     def _close_window(self):
          if self.parent_window: self.parent_window.close()
 
+    def paintEvent(self, event: QEvent):
+        """Paints the solid background and bottom border in two fills."""
+        painter = QPainter(self)
+        painter.fillRect(event.rect(), self.BACKGROUND_COLOR)
+        painter.fillRect(0, self.height() - 1, self.width(), 1, self.BORDER_COLOR)
+
     # --- Window Dragging Logic ---
     def mousePressEvent(self, event: QEvent):
         if self.parent_window and event.button() == Qt.LeftButton:
@@ -1060,6 +1544,13 @@ class CustomTopBar(QWidget):
             if widget_at_click is None or isinstance(widget_at_click, QLabel):
                 # Check if window is maximized - dragging shouldn't work then
                 if not self.parent_window.isMaximized():
+                    # Qt >= 5.15: hand the drag to the window manager, so no Python runs per move
+                    handle = self.parent_window.windowHandle()
+                    if handle is not None and hasattr(handle, "startSystemMove") and handle.startSystemMove():
+                        self.offset = None
+                        event.accept()
+                        return
+                    # Older Qt or unsupported platform: move the window from mouseMoveEvent
                     self.offset = event.globalPos() - self.parent_window.frameGeometry().topLeft()
                     event.accept()
                 else:
@@ -1073,16 +1564,13 @@ class CustomTopBar(QWidget):
             event.ignore()
 
     def mouseMoveEvent(self, event: QEvent):
-        if self.offset is not None and event.buttons() == Qt.LeftButton and self.parent_window:
-            # Ensure we are not dragging a maximized window
-            if not self.parent_window.isMaximized():
-                new_pos = event.globalPos() - self.offset
-                self.parent_window.move(new_pos)
-                event.accept()
-            else:
-                 event.ignore() # Ignore move if maximized or offset is None
-        else:
+        # offset is only set while dragging a normal window (MainWindow.changeEvent clears it
+        # on maximize), so one check covers the maximized and not-dragging cases
+        if self.offset is None or event.buttons() != Qt.LeftButton:
             event.ignore()
+            return
+        self.parent_window.move(event.globalPos() - self.offset)
+        event.accept()
 
     def mouseReleaseEvent(self, event: QEvent):
         if event.button() == Qt.LeftButton:
@@ -1098,8 +1586,14 @@ class MainWindow(QMainWindow):
         super().__init__()
         log.info("Initializing MainWindow...")
         self._setup_window_properties()
-        self._setup_ui()
-        self._load_app_icon()
+        # Build every screen and the top bar with updates off (children inherit it), so the
+        # many addWidget/setIcon calls trigger one repaint instead of one per change
+        self.setUpdatesEnabled(False)
+        try:
+            self._setup_ui()
+            self._load_app_icon()
+        finally:
+            self.setUpdatesEnabled(True)
         log.info("MainWindow UI initialization complete.")
 
     def _setup_window_properties(self):
@@ -1109,7 +1603,7 @@ class MainWindow(QMainWindow):
         # Set object name for potential styling via main stylesheet if needed
         self.setObjectName("MainWindow")
         # Set window title (useful for taskbar identification)
-        self.setWindowTitle(f"{ASSISTANT_NAME.capitalize()} AI")
+        self.setWindowTitle(WINDOW_TITLE)
 
     def _setup_ui(self):
         """Creates the main UI layout and widgets."""
@@ -1118,8 +1612,7 @@ class MainWindow(QMainWindow):
 
         # Central widget setup
         central_widget = QWidget(self)
-        # Apply base background color here, specific widgets can override
-        central_widget.setStyleSheet("background-color: #121212;")
+        central_widget.setObjectName("centralWidget") # Background comes from the global stylesheet
         self.setCentralWidget(central_widget)
 
         # Main layout
@@ -1130,9 +1623,12 @@ class MainWindow(QMainWindow):
         # Stacked widget for screens
         self.stacked_widget = QStackedWidget()
         initial_screen = InitialScreen(self.stacked_widget)
-        message_screen = MessageScreen(self.stacked_widget)
+        # MessageScreen is built by ensure_message_screen the first time Chat is opened
+        self.message_screen: Optional[MessageScreen] = None
+        self._message_placeholder = QWidget(self.stacked_widget)
         self.stacked_widget.addWidget(initial_screen) # Index 0
-        self.stacked_widget.addWidget(message_screen) # Index 1
+        self.stacked_widget.addWidget(self._message_placeholder) # Index 1
+        self.stacked_widget.currentChanged.connect(self._on_page_changed)
 
         # Custom top bar
         self.top_bar = CustomTopBar(self, self.stacked_widget)
@@ -1144,13 +1640,8 @@ class MainWindow(QMainWindow):
     def _set_initial_geometry(self):
         """Sets the initial size and position of the window, centered."""
         try:
-            screen = QApplication.primaryScreen()
-            if not screen:
-                 screens = QApplication.screens()
-                 if screens: screen = screens[0]
-            if screen:
-                available_geo = screen.availableGeometry()
-                log.info(f"Available screen geometry: {available_geo.width()}x{available_geo.height()} at ({available_geo.x()},{available_geo.y()})")
+            available_geo = available_screen_geometry()
+            if available_geo:
                 # Calculate initial size as a percentage of available space, with min/max caps
                 initial_width = max(800, min(1200, int(available_geo.width() * 0.65)))
                 initial_height = max(600, min(900, int(available_geo.height() * 0.7)))
@@ -1171,41 +1662,65 @@ class MainWindow(QMainWindow):
         try:
             app_icon_path = graphics_directory_path("app_icon.png")
             log.info(f"MainWindow: Loading App icon from: {app_icon_path}")
-            app_icon = QIcon(app_icon_path)
+            app_icon = cached_icon("app_icon.png")
             if not app_icon.isNull():
                 self.setWindowIcon(app_icon)
                 log.info("Application icon set successfully.")
             else:
-                log.warning(f"Application icon loaded but is invalid: {app_icon_path}")
-                if not os.path.exists(app_icon_path):
-                     log.error(f"Application icon file not found at physical path: {app_icon_path}")
+                log.warning(f"Application icon missing or invalid: {app_icon_path}")
         except Exception as e:
             log.error(f"Error setting application icon: {e}", exc_info=True)
 
+    def ensure_message_screen(self) -> MessageScreen:
+        """Builds the Chat page on first use, replacing its placeholder at index 1."""
+        # Replies given before this are replayed from backend_bridge's backlog when the
+        # screen's ChatSection connects
+        if self.message_screen is None:
+            log.info("Building MessageScreen on first navigation to Chat...")
+            self.message_screen = MessageScreen(self.stacked_widget)
+            self.stacked_widget.removeWidget(self._message_placeholder)
+            self.stacked_widget.insertWidget(1, self.message_screen)
+            self._message_placeholder.deleteLater()
+            self._message_placeholder = None
+        return self.message_screen
+
+    @pyqtSlot(int)
+    def _on_page_changed(self, index: int):
+        """Lets pages pause their polling while hidden.
+
+        ChatSection keeps watching Responses.data so replies given on the Home page are
+        still in the chat; the Home GIF already pauses itself via hide/show events.
+        """
+        if self.message_screen is not None:
+            self.message_screen.set_active(index == 1)
+
     # --- Event Handlers ---
     def changeEvent(self, event: QEvent):
-        """Handle window state changes (minimize, maximize, restore) to update buttons."""
+        """Handle maximize/restore state changes to update the top bar's maximize button."""
         super().changeEvent(event)
         if event.type() == QEvent.WindowStateChange:
-            # Check if the state change is relevant (maximized, minimized, normal)
-            if self.windowState() & (Qt.WindowMaximized | Qt.WindowMinimized | Qt.WindowNoState):
-                log.debug(f"Window state changed to: {self.windowState()}")
-                if hasattr(self, 'top_bar') and self.top_bar:
-                    # Use singleShot to ensure the update happens after the state change is fully processed
-                    QTimer.singleShot(0, self.top_bar._update_maximize_button_icon)
-                else:
-                    log.warning("Window state changed but top_bar not found or not initialized yet.")
+            # Only the maximized bit matters to the top bar; ignore minimize/active-only flips
+            maximized = bool(self.windowState() & Qt.WindowMaximized)
+            if maximized == bool(event.oldState() & Qt.WindowMaximized):
+                return
+            log.debug("Window state changed to: %s", self.windowState())
+            if hasattr(self, 'top_bar') and self.top_bar:
+                if maximized:
+                    self.top_bar.offset = None # End any drag; maximized windows don't move
+                # windowState() already reports the new state here, so update synchronously
+                # instead of posting a deferred call
+                self.top_bar._update_maximize_button_icon()
+            else:
+                log.warning("Window state changed but top_bar not found or not initialized yet.")
 
     def closeEvent(self, event: QEvent):
         """Handle the window close event (e.g., clicking the 'X' button)."""
         log.info("Close event triggered. Cleaning up timers...")
         try:
-            # Stop timers in screens
-            initial_screen = self.stacked_widget.widget(0)
+            # Stop the shared status timer and the chat screen's timers
             message_screen = self.stacked_widget.widget(1)
 
-            if isinstance(initial_screen, InitialScreen):
-                initial_screen.stop_timer()
+            status_broadcaster().stop_timer()
             if isinstance(message_screen, MessageScreen):
                 message_screen.stop_timers() # This should stop its own timer and the chat section's timer
 
@@ -1221,142 +1736,208 @@ class MainWindow(QMainWindow):
 def initialize_data_files():
     """Checks and initializes necessary data files on startup."""
     log.info("Initializing data files...")
-    files_to_check = {
-        MIC_DATA_FILE: "False",
-        STATUS_DATA_FILE: "Initializing...",
-        RESPONSES_DATA_FILE: "",
-        GENERATED_IMAGE_DATA_FILE: "" # Clear/create image data file on startup
-    }
     try:
-        os.makedirs(TEMP_DIR_PATH, exist_ok=True) # Ensure directory exists first
-        for filepath, default_content in files_to_check.items():
-            # For GeneratedImage.data, always clear/create it
-            if filepath == GENERATED_IMAGE_DATA_FILE:
-                _safe_file_write(filepath, "") # Write empty string to clear or create
-                log.info(f"Checked/Cleared {os.path.basename(filepath)}")
-            else:
-                # For others, use read which creates with default if missing
-                _safe_file_read(filepath)
-                log.info(f"Checked/Initialized {os.path.basename(filepath)}")
+        # The directory and files were created at import; this only recreates anything
+        # deleted since then (one open() per file) and clears a leftover image path
+        for filepath, default_content in _DATA_FILE_DEFAULTS.items():
+            _create_data_file_if_missing(filepath, default_content)
+        if os.stat(GENERATED_IMAGE_DATA_FILE).st_size:
+            _safe_file_write(GENERATED_IMAGE_DATA_FILE, "") # Don't show last session's image
         log.info(f"Persistent data files checked/initialized in: {TEMP_DIR_PATH}")
     except Exception as e:
         log.critical(f"FATAL ERROR during data file initialization: {e}", exc_info=True)
         # Exit if critical file operations fail
         sys.exit(1)
 
-def set_global_stylesheet(app: QApplication):
-    """Applies a global stylesheet to the application."""
-    app.setStyleSheet("""
-        /* General Styles */
-        QWidget {
-            background-color: #121212;
-            color: #f0f0f0;
-            font-family: "Segoe UI", Arial, sans-serif; /* Added fallback fonts */
-            font-size: 10pt; /* Base font size in points */
-        }
-        QMainWindow {
-            border: 1px solid #383838; /* Add a border for frameless window if needed */
-        }
-        QLabel {
-            background-color: transparent;
-            color: #cccccc;
-        }
-        QTextEdit {
-            background-color: #1e1e1e;
-            color: #f0f0f0;
-            border: 1px solid #333333;
-            border-radius: 5px;
-            padding: 8px;
-            font-size: 10pt; /* Consistent font size */
-        }
-        QPushButton {
-            background-color: #333333;
-            color: #f0f0f0;
-            border: 1px solid #555555;
-            padding: 8px 15px;
-            border-radius: 5px;
-            font-size: 10pt;
-            min-height: 28px; /* Minimum height */
-        }
-        QPushButton:hover {
-            background-color: #444444;
-            border-color: #777777;
-        }
-        QPushButton:pressed {
-            background-color: #505050;
-        }
-        QPushButton:disabled {
-            background-color: #2a2a2a;
-            color: #555555;
-            border-color: #444444;
-        }
-        QPushButton:focus {
-            /* Optional: Add a subtle focus indicator if desired, e.g.,
-            border: 1px solid #55aaff;
-            */
-            outline: none; /* Remove default outline */
-        }
-        QToolTip {
-            background-color: #282828;
-            color: #f0f0f0;
-            border: 1px solid #555;
-            padding: 5px;
-            border-radius: 3px;
-            opacity: 230; /* Semi-transparent */
-        }
+def _compact_qss(qss: str) -> str:
+    """Strips comments and collapses whitespace so Qt's QSS parser tokenizes less."""
+    qss = re.sub(r"/\*.*?\*/", "", qss, flags=re.DOTALL)
+    return re.sub(r"\s+", " ", qss).strip()
+
+# Readable source below; the compacted string is built once at import
+GLOBAL_STYLESHEET = _compact_qss("""
+    /* General Styles */
+    QWidget {
+        background-color: #121212;
+        color: #f0f0f0;
+        /* Base font (Segoe UI 10pt) is the application font, see APP_FONT_* */
+    }
+    QMainWindow {
+        border: 1px solid #383838; /* Add a border for frameless window if needed */
+    }
+    QLabel {
+        background-color: transparent;
+        color: #cccccc;
+    }
+    QTextEdit, QPlainTextEdit {
+        background-color: #1e1e1e;
+        color: #f0f0f0;
+        border: 1px solid #333333;
+        border-radius: 5px;
+        padding: 8px;
+        font-size: 10pt; /* Consistent font size */
+    }
+    QPushButton {
+        background-color: #333333;
+        color: #f0f0f0;
+        border: 1px solid #555555;
+        padding: 8px 15px;
+        border-radius: 5px;
+        min-height: 28px; /* Minimum height */
+    }
+    QPushButton:hover {
+        background-color: #444444;
+        border-color: #777777;
+    }
+    QPushButton:pressed {
+        background-color: #505050;
+    }
+    QPushButton:disabled {
+        background-color: #2a2a2a;
+        color: #555555;
+        border-color: #444444;
+    }
+    QPushButton:focus {
+        /* Optional: Add a subtle focus indicator if desired, e.g.,
+        border: 1px solid #55aaff;
+        */
+        outline: none; /* Remove default outline */
+    }
+    QWidget#centralWidget {
+        background-color: #121212;
+    }
 
-        /* Scrollbar Styling */
-        QScrollBar:vertical {
-            border: none;
-            background: #1e1e1e; /* Match QTextEdit background */
-            width: 10px; /* Slightly slimmer */
-            margin: 0px;
-            border-radius: 5px;
-        }
-        QScrollBar::handle:vertical {
-            background: #555555;
-            min-height: 30px;
-            border-radius: 5px;
-        }
-        QScrollBar::handle:vertical:hover {
-            background: #666666;
-        }
-        QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-            /* Remove arrows */
-            border: none;
-            background: none;
-            height: 0px;
-            subcontrol-position: top;
-            subcontrol-origin: margin;
-        }
-        QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
-            background: none;
-        }
+    /* Top Bar (its background and border are painted by CustomTopBar.paintEvent) */
+    QLabel#topBarTitle {
+        color: #66bbff; /* Lighter blue */
+        font-size: 14pt; /* Use points for font size */
+        font-weight: bold;
+        padding-left: 5px;
+        background-color: transparent;
+        border: none;
+    }
+    QPushButton#navBtn {
+        background-color: transparent;
+        color: #e0e0e0; /* Lighter text */
+        border: none;
+        padding: 5px 10px;
+        border-radius: 5px;
+        min-height: 32px;
+        text-align: left;
+    }
+    QPushButton#navBtn:hover { background-color: #3a3a3a; }
+    QPushButton#navBtn:pressed { background-color: #484848; }
+    QPushButton#ctrlBtn, QPushButton#closeBtn {
+        background-color: transparent;
+        border: none;
+        padding: 0px;
+        border-radius: 5px;
+        min-width: 38px; max-width: 38px; /* Slightly wider */
+        min-height: 32px; max-height: 32px; /* Match nav buttons */
+    }
+    QPushButton#ctrlBtn:hover { background-color: #444444; }
+    QPushButton#ctrlBtn:pressed { background-color: #555555; }
+    QPushButton#closeBtn:hover { background-color: #E81123; }
+    QPushButton#closeBtn:pressed { background-color: #F1707A; }
+
+    /* Generated Image Area */
+    QFrame#ImageContainerFrame {
+        background-color: #1A1A1A; /* Slightly different background */
+        border: 1px solid #333333;
+        border-radius: 8px;
+    }
+    QLabel#ImageDisplayLabel {
+        border: none;
+        background-color: transparent;
+        color: #888888; /* Placeholder and error text */
+    }
+    QPushButton#imageCloseBtn {
+        background-color: transparent;
+        border: none;
+        color: #AAAAAA; /* Default color for 'X' text */
+        border-radius: 4px;
+    }
+    QPushButton#imageCloseBtn:hover {
+        background-color: #E81123; /* Red hover */
+        color: white; /* White 'X' on hover */
+    }
+    QPushButton#imageCloseBtn:pressed { background-color: #F1707A; } /* Lighter red pressed */
+
+    QToolTip {
+        background-color: #282828;
+        color: #f0f0f0;
+        border: 1px solid #555;
+        padding: 5px;
+        border-radius: 3px;
+        opacity: 230; /* Semi-transparent */
+    }
 
-        QScrollBar:horizontal {
-            border: none;
-            background: #1e1e1e;
-            height: 10px;
-            margin: 0px;
-            border-radius: 5px;
-        }
-        QScrollBar::handle:horizontal {
-            background: #555555;
-            min-width: 30px;
-            border-radius: 5px;
-        }
-        QScrollBar::handle:horizontal:hover {
-            background: #666666;
-        }
-        QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
-            border: none;
-            background: none;
-            width: 0px;
-        }
-        QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal {
-            background: none;
-        }
-    """)
+    /* Scrollbar Styling */
+    QScrollBar:vertical {
+        border: none;
+        background: #1e1e1e; /* Match text view background */
+        width: 10px; /* Slightly slimmer */
+        margin: 0px;
+        border-radius: 5px;
+    }
+    QScrollBar::handle:vertical {
+        background: #555555;
+        min-height: 30px;
+        border-radius: 5px;
+    }
+    QScrollBar::handle:vertical:hover {
+        background: #666666;
+    }
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+        /* Remove arrows */
+        border: none;
+        background: none;
+        height: 0px;
+        subcontrol-position: top;
+        subcontrol-origin: margin;
+    }
+    QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
+        background: none;
+    }
+
+    QScrollBar:horizontal {
+        border: none;
+        background: #1e1e1e;
+        height: 10px;
+        margin: 0px;
+        border-radius: 5px;
+    }
+    QScrollBar::handle:horizontal {
+        background: #555555;
+        min-width: 30px;
+        border-radius: 5px;
+    }
+    QScrollBar::handle:horizontal:hover {
+        background: #666666;
+    }
+    QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
+        border: none;
+        background: none;
+        width: 0px;
+    }
+    QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal {
+        background: none;
+    }
+""")
+
+APP_FONT_FAMILY = "Segoe UI"
+APP_FONT_POINT_SIZE = 10
+
+def set_global_stylesheet(app: QApplication):
+    """Applies the application font and global stylesheet (once; widgets style via object names)."""
+    # The base font lives on the application rather than in a QWidget QSS rule, so Qt
+    # resolves it once instead of per widget on every polish
+    QFont.insertSubstitution(APP_FONT_FAMILY, "Arial")
+    app.setFont(QFont(APP_FONT_FAMILY, APP_FONT_POINT_SIZE))
+    # setStyleSheet repolishes every widget even when the text is identical, so skip repeats
+    if app.styleSheet() == GLOBAL_STYLESHEET:
+        return
+    app.setStyleSheet(GLOBAL_STYLESHEET)
     log.info("Global stylesheet applied.")
 
 
@@ -1374,12 +1955,19 @@ def graphical_user_interface():
 
     app = QApplication(sys.argv)
 
+    # Pull the window's graphics into the page cache while Qt sets up styles and fonts
+    threading.Thread(target=_warm_graphics_files, args=(_STARTUP_GRAPHICS,),
+                     name="GraphicsPreload", daemon=True).start()
+
     set_global_stylesheet(app)
 
     log.info("Creating MainWindow instance...")
     window = MainWindow()
     log.info("Showing MainWindow...")
     window.show()
+    if sys.platform == "darwin":
+        # macOS may not paint a newly shown frameless window until the next input event
+        QTimer.singleShot(0, window.repaint)
 
     log.info("Starting application event loop (app.exec_())...")
     exit_code = app.exec_()
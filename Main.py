@@ -1,18 +1,24 @@
 import os
 import sys
 import json
-import subprocess
+import importlib
 import threading
 import re
 import webbrowser
 import traceback
 import logging
 import platform
-from asyncio import run as asyncio_run
+import asyncio
+import concurrent.futures
 from time import sleep
 from pathlib import Path
 from dotenv import load_dotenv
-from urllib.parse import urlparse
+
+# Optional faster JSON codec for ChatLog.json (C, bytes in/out); stdlib json otherwise
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # 1. Activate the virtual environment:  .\venv\Scripts\Activate
 
@@ -23,7 +29,6 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 
 # --- Attempt to import GUI components ---
 try:
-    current_dir = os.path.dirname(os.path.abspath(__file__))
     # If needed:
     # sys.path.insert(0, current_dir)
     # sys.path.insert(0, os.path.join(current_dir, "Frontend"))
@@ -32,13 +37,14 @@ try:
 
     # Import the VARIABLE TEMP_DIR_PATH instead of the function TempDirectoryPath
     from Frontend.GUI import (
-        graphical_user_interface, set_assistant_status, show_text_to_screen,
+        graphical_user_interface, set_assistant_status, show_text_to_screen, show_texts_to_screen,
         TEMP_DIR_PATH, # <--- Corrected import
         set_microphone_status, # Renamed from SetMicrophoneStatus in GUI.py? Check GUI.py for exact name
-        answer_modifier, # Renamed from AnswerModifier? Check GUI.py
         query_modifier, # Renamed from QueryModifier? Check GUI.py
         get_microphone_status, # Renamed from GetMicrophoneStatus? Check GUI.py
-        get_assistant_status # Renamed from GetAssistantStatus? Check GUI.py
+        get_assistant_status, # Renamed from GetAssistantStatus? Check GUI.py
+        wait_for_microphone_on,
+        atomic_write_bytes
     )
     # NOTE: I noticed GUI.py uses snake_case (e.g., set_microphone_status) for the helper functions,
     # while main.py was using PascalCase (e.g., SetMicrophoneStatus).
@@ -63,36 +69,69 @@ except Exception as e:
     sys.exit(1)
 
 
-# --- Attempt to import Backend components ---
-try:
-    from Backend.Chatbot import ChatBot
-    from Backend.Model import FirstLayerDMM
-    from Backend.RealtimeSearchEngine import RealtimeSearchEngine
-    from Backend.Automation import automate as Automation
-    from Backend.SpeechToText import SpeechRecognition
-    from Backend.TextToSpeech import text_to_speech as TextToSpeech
-    logging.info("Successfully imported components from Backend")
-except ImportError as e:
-    logging.critical(f"Error importing from Backend: {e}", exc_info=True)
-    logging.critical(f"Current sys.path: {sys.path}")
-    logging.critical("Please ensure Backend modules are available relative to main.py and dependencies are installed.")
-    input("Press Enter to exit...")
-    sys.exit(1)
-except Exception as e:
-    logging.critical(f"An unexpected error occurred during Backend import: {e}", exc_info=True)
-    input("Press Enter to exit...")
-    sys.exit(1)
+# --- Lazy Backend components ---
+# The Backend modules pull in Selenium/Whisper, pygame, cohere, groq, etc. and some start
+# a browser at import, so they are imported on first use instead of before the window shows.
+# A failed import is remembered: re-running SpeechToText would relaunch Edge (with retries and
+# sleeps) on every mic cycle, and its sys.exit() would silently end the calling thread.
+_backend_errors: dict[str, BaseException] = {}
+_backend_import_locks: dict[str, threading.Lock] = {}
+_backend_import_locks_guard = threading.Lock()
+
+def import_backend(module_name: str):
+    """Imports a Backend module once; a failure (including SystemExit) is raised as RuntimeError
+    now and on every later call, without importing the module again."""
+    with _backend_import_locks_guard:
+        lock = _backend_import_locks.setdefault(module_name, threading.Lock())
+    with lock: # The preload thread and the mic thread may ask for the same module
+        error = _backend_errors.get(module_name)
+        if error is None:
+            try:
+                return importlib.import_module(module_name)
+            except (Exception, SystemExit) as e: # SpeechToText exits if the browser never starts
+                _backend_errors[module_name] = error = e
+    raise RuntimeError(f"Backend module {module_name} failed to load: {error!r}") from error
+
+def _lazy(module_name: str, attr: str):
+    """Returns a stand-in that imports module_name on its first call and forwards to attr."""
+    target = None
+    def call(*args, **kwargs):
+        nonlocal target
+        if target is None:
+            target = getattr(import_backend(module_name), attr)
+        return target(*args, **kwargs)
+    call.__name__ = attr
+    return call
+
+ChatBot = _lazy("Backend.Chatbot", "ChatBot")
+FirstLayerDMM = _lazy("Backend.Model", "FirstLayerDMM")
+RealtimeSearchEngine = _lazy("Backend.RealtimeSearchEngine", "RealtimeSearchEngine")
+Automation = _lazy("Backend.Automation", "automate")
+SpeechRecognition = _lazy("Backend.SpeechToText", "SpeechRecognition")
+TextToSpeech = _lazy("Backend.TextToSpeech", "text_to_speech")
+
+# Needed by every voice cycle; loaded in the background once the GUI is starting
+_PRELOAD_MODULES = ("Backend.SpeechToText", "Backend.Model", "Backend.TextToSpeech")
+
+def preload_backend():
+    """Imports the per-cycle Backend modules off the GUI thread so the first query isn't slow."""
+    for module_name in _PRELOAD_MODULES:
+        try:
+            import_backend(module_name)
+            logging.info(f"Loaded backend module: {module_name}")
+        except RuntimeError as e:
+            logging.critical(f"Error importing {module_name}: {e}", exc_info=True)
+            logging.critical("Please ensure Backend modules are available relative to main.py and dependencies are installed.")
+            show_text_to_screen(f"{ASSISTANT_NAME}: Failed to load {module_name}; check the log.")
 
 # ─── PATH HELPER ──────────────────────────────────────────────────────────────
+# Resolved once: the bundle directory when frozen by PyInstaller, else this file's directory
+_BASE_PATH = getattr(sys, "_MEIPASS", None) or os.path.dirname(os.path.abspath(__file__))
+logging.info(f"Running in {'frozen (PyInstaller)' if hasattr(sys, '_MEIPASS') else 'development'} mode. Base path: {_BASE_PATH}")
+
 def resource_path(relative_path):
     """Get absolute path for PyInstaller and dev mode"""
-    try:
-        base_path = sys._MEIPASS
-        logging.info(f"Running in frozen mode (PyInstaller). Base path: {base_path}")
-    except AttributeError:
-        base_path = os.path.dirname(os.path.abspath(__file__))
-        logging.info(f"Running in development mode. Base path: {base_path}")
-    return os.path.join(base_path, relative_path)
+    return os.path.join(_BASE_PATH, relative_path)
 
 # ─── CONFIG & LOGGING ─────────────────────────────────────────────────────────
 try:
@@ -110,6 +149,7 @@ USERNAME = os.getenv("Username", "User")
 ASSISTANT_NAME = os.getenv("Assistantname", "Assistant")
 DEFAULT_MESSAGE_USER = f"{USERNAME}: Hello {ASSISTANT_NAME}, How are you?"
 DEFAULT_MESSAGE_ASSISTANT = f"{ASSISTANT_NAME}: Welcome {USERNAME}. I am doing well. How may I help you?"
+_ROLE_PREFIX = {"user": f"{USERNAME}: ", "assistant": f"{ASSISTANT_NAME}: "}
 
 # ─── GLOBAL PATHS & STATE ───────────────────────────────────────────────────────
 BASE_DIR = os.path.dirname(resource_path('.'))
@@ -119,85 +159,131 @@ os.makedirs(DATA_DIR, exist_ok=True)
 CHATLOG_PATH = os.path.join(DATA_DIR, "ChatLog.json")
 logging.info(f"Chatlog path set to: {CHATLOG_PATH}")
 
-# TEMP_DIR_PATH is now imported directly from GUI.py
+# TEMP_DIR_PATH is now imported directly from GUI.py; these files never move during a run
+RESPONSES_DATA_PATH = os.path.join(TEMP_DIR_PATH, "Responses.data")
+IMAGE_RESULT_PATH = os.path.join(TEMP_DIR_PATH, "GeneratedImage.data")
 
-SUBPROCESS_LIST = []
 FUNCTIONS = ["open", "close", "play", "system", "content", "google search", "Youtube"]
+_FUNCTION_SET = frozenset(FUNCTIONS) # O(1) membership for the per-decision automation check
+_NO_PARENS = str.maketrans("", "", "()") # C-level two-character delete, cheaper than a regex sub
+_URL_RE = re.compile(r"(https?://)|www\.", re.IGNORECASE) # group 1 set when a scheme is present
+_EXIT_COMMANDS = frozenset(("exit", "quit", "goodbye", "bye", "shutdown"))
 EXIT_REQUESTED = False
+# get_assistant_status returns one whole status string, so equality against a set replaces the
+# old chains of substring tests
+_BUSY_STATUSES = frozenset(("Listening...", "Thinking...", "Answering...", "Executing...",
+                            "Searching...", "Generating..."))
+_CYCLE_END_KEEP_STATUSES = frozenset(("Available...", "Shutting down...", "EXIT_REQUESTED",
+                                      "Generating Image...", "Error!"))
+ERROR_STATUS_SECONDS = 2.0 # How long "Error!" stays up before the status returns to Available
+_error_status_timer: threading.Timer | None = None
+MIC_WAIT_TIMEOUT = 1.0 # Seconds the idle mic thread blocks before re-checking EXIT_REQUESTED
+AUTOMATION_TIMEOUT = 60.0 # Seconds the mic thread waits for an automation command before giving up
 
 # ─── INITIALIZATION & CHAT HISTORY HELPERS ─────────────────────────────────────
 
+def atomic_write_text(path: str, text: str):
+    """Frontend.GUI.atomic_write_bytes for UTF-8 text."""
+    atomic_write_bytes(path, text.encode("utf-8"))
+
+def _loads_chatlog(data: bytes):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+def _dumps_chatlog(messages: list) -> bytes:
+    """UTF-8 JSON with 2-space indent, matching Main's previous json.dump(indent=2)."""
+    if orjson is not None:
+        return orjson.dumps(messages, option=orjson.OPT_INDENT_2)
+    return json.dumps(messages, indent=2, ensure_ascii=False).encode("utf-8")
+
+_chatlog_checked = False # Set once the file is known to exist; read_chatlog clears it if it vanishes
+
 def ensure_chatlog_exists():
     """Creates an empty chatlog JSON file if it doesn't exist."""
+    global _chatlog_checked
+    if _chatlog_checked: return
     if not os.path.exists(CHATLOG_PATH):
         logging.info(f"Chatlog file not found at {CHATLOG_PATH}. Creating empty file.")
         try:
-            with open(CHATLOG_PATH, "w", encoding="utf-8") as f: json.dump([], f)
+            atomic_write_text(CHATLOG_PATH, "[]")
         except IOError as e:
             logging.error(f"Failed to create chatlog file at {CHATLOG_PATH}: {e}", exc_info=True)
             raise
+    _chatlog_checked = True
+
+# Parsed ChatLog.json plus the (st_mtime_ns, st_size) it was read/written at; other modules
+# (Chatbot, RealtimeSearchEngine) also write the file, so the stat decides when to re-parse
+_chatlog_cache = {"stat": None, "messages": None}
+
+def read_chatlog() -> list:
+    """Returns the chat log entries, re-parsing ChatLog.json only when it changed on disk."""
+    global _chatlog_checked
+    ensure_chatlog_exists()
+    try:
+        st = os.stat(CHATLOG_PATH)
+    except FileNotFoundError: # Deleted after the first check; recreate it
+        _chatlog_checked = False
+        ensure_chatlog_exists()
+        st = os.stat(CHATLOG_PATH)
+    stat_key = (st.st_mtime_ns, st.st_size)
+    if stat_key == _chatlog_cache["stat"]:
+        return _chatlog_cache["messages"]
+    with open(CHATLOG_PATH, "rb") as f:
+        try:
+            messages = _loads_chatlog(f.read())
+            if not isinstance(messages, list):
+                logging.warning(f"Chatlog file {CHATLOG_PATH} invalid. Resetting.")
+                messages = []
+        except (ValueError, UnicodeDecodeError): # json/orjson.JSONDecodeError are ValueErrors
+            logging.warning(f"Chatlog file {CHATLOG_PATH} corrupted/empty. Resetting.")
+            messages = []
+    _chatlog_cache["stat"] = stat_key
+    _chatlog_cache["messages"] = messages
+    return messages
 
 def load_and_display_chat_history():
     """Loads chat history from ChatLog.json and displays it on the GUI via show_text_to_screen."""
-    ensure_chatlog_exists()
     formatted_messages = []
     try:
-        with open(CHATLOG_PATH, "r", encoding="utf-8") as f:
-            try:
-                messages = json.load(f)
-                if not isinstance(messages, list):
-                    logging.warning(f"Chatlog file {CHATLOG_PATH} invalid. Resetting.")
-                    messages = []
-            except json.JSONDecodeError:
-                logging.warning(f"Chatlog file {CHATLOG_PATH} corrupted/empty. Resetting.")
-                messages = []
+        messages = read_chatlog()
 
         if messages:
-            for entry in messages:
-                role = entry.get("role")
-                text = entry.get("content", "").strip()
-                if not text: continue
-                prefix = f"{USERNAME}: " if role == "user" else f"{ASSISTANT_NAME}: " if role == "assistant" else ""
-                formatted_messages.append(f"{prefix}{text}")
+            prefix_for = _ROLE_PREFIX.get
+            formatted_messages = [
+                prefix_for(entry.get("role"), "") + text
+                for entry in messages
+                if (text := entry.get("content", "").strip())
+            ]
         else:
             logging.info("Chatlog is empty. Displaying default welcome message.")
             formatted_messages.append(DEFAULT_MESSAGE_USER)
             formatted_messages.append(DEFAULT_MESSAGE_ASSISTANT)
 
-        # Use the imported TEMP_DIR_PATH variable
-        resp_path = os.path.join(TEMP_DIR_PATH, "Responses.data")
         try:
-            with open(resp_path, "w", encoding="utf-8") as f: f.write("") # Clear the file
-            logging.info(f"Cleared display file: {resp_path}")
+            atomic_write_text(RESPONSES_DATA_PATH, "") # Clear the file
+            logging.info(f"Cleared display file: {RESPONSES_DATA_PATH}")
         except IOError as e:
-            logging.error(f"Failed to clear display file {resp_path}: {e}", exc_info=True)
+            logging.error(f"Failed to clear display file {RESPONSES_DATA_PATH}: {e}", exc_info=True)
 
-        for msg in formatted_messages:
-            # Use the imported answer_modifier (assuming it's correct name from GUI.py)
-            show_text_to_screen(answer_modifier(msg))
+        show_texts_to_screen(formatted_messages)
         logging.info(f"Loaded {len(formatted_messages)} messages onto GUI display.")
 
     except IOError as e:
         logging.error(f"Failed to read chatlog file {CHATLOG_PATH}: {e}", exc_info=True)
-        show_text_to_screen(answer_modifier(DEFAULT_MESSAGE_USER))
-        show_text_to_screen(answer_modifier(DEFAULT_MESSAGE_ASSISTANT))
+        show_text_to_screen(DEFAULT_MESSAGE_USER)
+        show_text_to_screen(DEFAULT_MESSAGE_ASSISTANT)
     except Exception as e:
         logging.error(f"Error during chat history loading: {e}", exc_info=True)
         show_text_to_screen(f"{ASSISTANT_NAME}: Error loading chat history.")
 
 def save_message_to_chatlog(role: str, text: str):
     """Appends a message to the ChatLog.json file."""
-    ensure_chatlog_exists()
     new_message = {"role": role, "content": text.strip()}
     try:
-        with open(CHATLOG_PATH, "r+", encoding="utf-8") as f:
-            try:
-                messages = json.load(f)
-                if not isinstance(messages, list): messages = []
-            except json.JSONDecodeError: messages = []
-            messages.append(new_message)
-            f.seek(0); f.truncate()
-            json.dump(messages, f, indent=2, ensure_ascii=False)
+        messages = read_chatlog() # Cached list unless another module wrote the file since
+        messages.append(new_message)
+        atomic_write_bytes(CHATLOG_PATH, _dumps_chatlog(messages))
+        st = os.stat(CHATLOG_PATH)
+        _chatlog_cache["stat"] = (st.st_mtime_ns, st.st_size)
     except IOError as e:
         logging.error(f"Failed to save message to chatlog file {CHATLOG_PATH}: {e}", exc_info=True)
     except Exception as e:
@@ -229,6 +315,29 @@ def initial_setup():
         raise
 
 
+# ─── BACKGROUND EVENT LOOP ────────────────────────────────────────────────────
+# One event loop lives for the whole process on a daemon thread. Automation commands and image
+# generation are submitted to it instead of building a fresh loop (and default executor, used by
+# Backend.Automation's asyncio.to_thread calls) with asyncio.run() every time.
+_async_loop = asyncio.new_event_loop()
+
+def _run_async_loop():
+    """AsyncLoop thread target; restarts the loop if a task's SystemExit/KeyboardInterrupt escapes it."""
+    while True:
+        try:
+            _async_loop.run_forever()
+            return # Stopped by the shutdown sequence
+        except BaseException as e:
+            if EXIT_REQUESTED: return
+            logging.error(f"Background event loop crashed, restarting it: {e!r}", exc_info=True)
+
+threading.Thread(target=_run_async_loop, name="AsyncLoop", daemon=True).start()
+
+def submit_coroutine(coro):
+    """Schedules coro on the background loop; returns a concurrent.futures.Future."""
+    return asyncio.run_coroutine_threadsafe(coro, _async_loop)
+
+
 # ─── COMMAND HANDLERS ─────────────────────────────────────────────────────────
 def handle_general(query: str):
     """Handles general queries using the ChatBot."""
@@ -240,19 +349,17 @@ def handle_general(query: str):
         response = ChatBot(modified_query).strip()
         logging.info(f"ChatBot response: {response[:50]}...")
         set_assistant_status("Answering...")
-        # Use imported answer_modifier
-        show_text_to_screen(answer_modifier(f"{ASSISTANT_NAME}: {response}"))
+        show_text_to_screen(f"{ASSISTANT_NAME}: {response}")
         save_message_to_chatlog("assistant", response)
         TextToSpeech(response)
     except Exception as e:
         logging.error(f"Error during ChatBot interaction: {e}", exc_info=True)
         error_message = "Sorry, I encountered an error trying to respond."
-        show_text_to_screen(answer_modifier(f"{ASSISTANT_NAME}: {error_message}"))
+        show_text_to_screen(f"{ASSISTANT_NAME}: {error_message}")
         save_message_to_chatlog("assistant", error_message)
         TextToSpeech(error_message)
     finally:
-        # Use imported get_assistant_status
-        if not EXIT_REQUESTED and "Available..." not in get_assistant_status():
+        if not EXIT_REQUESTED and get_assistant_status() != "Available...":
              set_assistant_status("Available...")
 
 
@@ -266,67 +373,67 @@ def handle_realtime(query: str):
         response = RealtimeSearchEngine(modified_query).strip()
         logging.info(f"RealtimeSearch response: {response[:50]}...")
         set_assistant_status("Answering...")
-        # Use imported answer_modifier
-        show_text_to_screen(answer_modifier(f"{ASSISTANT_NAME}: {response}"))
+        show_text_to_screen(f"{ASSISTANT_NAME}: {response}")
         save_message_to_chatlog("assistant", response)
         TextToSpeech(response)
     except Exception as e:
         logging.error(f"Error during RealtimeSearchEngine interaction: {e}", exc_info=True)
         error_message = "Sorry, I couldn't complete the search."
-        show_text_to_screen(answer_modifier(f"{ASSISTANT_NAME}: {error_message}"))
+        show_text_to_screen(f"{ASSISTANT_NAME}: {error_message}")
         save_message_to_chatlog("assistant", error_message)
         TextToSpeech(error_message)
     finally:
-        # Use imported get_assistant_status
-        if not EXIT_REQUESTED and "Available..." not in get_assistant_status():
+        if not EXIT_REQUESTED and get_assistant_status() != "Available...":
              set_assistant_status("Available...")
 
+async def _generate_image(prompt: str):
+    """Generates the image; Backend.ImageGeneration writes its path to GeneratedImage.data."""
+    # aiohttp/PIL are imported on the first request, off the loop thread
+    try:
+        image_generation = await asyncio.to_thread(importlib.import_module, "Backend.ImageGeneration")
+    except SystemExit as exit_error: # The module exits at import if it can't create its directories
+        raise RuntimeError(f"Backend.ImageGeneration exited during import (code {exit_error.code})") from exit_error
+    await image_generation.generate_and_open_images(prompt)
+
+def _on_image_generated(future, prompt: str):
+    """Done-callback for _generate_image (runs on the loop thread)."""
+    try:
+        future.result()
+        logging.info(f"Finished image generation for prompt: {prompt[:50]}...")
+    except Exception as e:
+        logging.error(f"Image generation failed: {e}", exc_info=True)
+        try:
+            atomic_write_text(IMAGE_RESULT_PATH, "ERROR: Image generation failed")
+        except Exception: pass
+    finally:
+        if not EXIT_REQUESTED and get_assistant_status() == "Generating Image...":
+            set_assistant_status("Available...")
+
 def handle_image_generation(prompt: str):
     """Handles image generation requests."""
     logging.info(f"Handling image generation request: {prompt[:50]}...")
     set_assistant_status("Generating Image...")
-    # Use imported TEMP_DIR_PATH variable
-    img_comm_file = os.path.join(TEMP_DIR_PATH, "imageGeneration.data")
-    img_result_file = os.path.join(TEMP_DIR_PATH, "GeneratedImage.data")
 
     try:
-        with open(img_comm_file, "w", encoding="utf-8") as f: f.write(f"{prompt},True")
-        logging.info(f"Wrote image prompt to trigger file: {img_comm_file}")
-        with open(img_result_file, "w", encoding="utf-8") as f: f.write("")
-        logging.info(f"Cleared previous image result file: {img_result_file}")
-
-        script_path = resource_path(os.path.join("Backend", "ImageGeneration.py"))
-        if not os.path.exists(script_path):
-             logging.error(f"Image generation script not found at {script_path}")
-             error_message = "Sorry, the image generation module is missing."
-             show_text_to_screen(answer_modifier(f"{ASSISTANT_NAME}: {error_message}"))
-             save_message_to_chatlog("assistant", error_message)
-             TextToSpeech(error_message)
-             set_assistant_status("Available...")
-             with open(img_comm_file, "w", encoding="utf-8") as f: f.write("Error,False")
-             return
+        atomic_write_text(IMAGE_RESULT_PATH, "")
+        logging.info(f"Cleared previous image result file: {IMAGE_RESULT_PATH}")
 
-        logging.info(f"Launching image generation script: {script_path}")
-        creationflags = 0
-        if platform.system() == "Windows": creationflags = subprocess.CREATE_NO_WINDOW
-        proc = subprocess.Popen([sys.executable, script_path], stdout=subprocess.PIPE, stderr=subprocess.PIPE, creationflags=creationflags)
-        SUBPROCESS_LIST.append(proc)
+        future = submit_coroutine(_generate_image(prompt))
+        future.add_done_callback(lambda f: _on_image_generated(f, prompt))
+        logging.info("Submitted image generation job.")
 
         confirmation_message = f"Okay, I'm starting to generate an image based on: {prompt[:30]}..."
-        show_text_to_screen(answer_modifier(f"{ASSISTANT_NAME}: {confirmation_message}"))
+        show_text_to_screen(f"{ASSISTANT_NAME}: {confirmation_message}")
         save_message_to_chatlog("assistant", confirmation_message)
         TextToSpeech(confirmation_message)
 
     except Exception as e:
         logging.error(f"Error initiating image generation: {e}", exc_info=True)
         error_message = "Sorry, I couldn't start the image generation process."
-        show_text_to_screen(answer_modifier(f"{ASSISTANT_NAME}: {error_message}"))
+        show_text_to_screen(f"{ASSISTANT_NAME}: {error_message}")
         save_message_to_chatlog("assistant", error_message)
         TextToSpeech(error_message)
         set_assistant_status("Available...")
-        try:
-            with open(img_comm_file, "w", encoding="utf-8") as f: f.write("Error,False")
-        except Exception: pass
 
 
 def sanitize_automation_cmd(cmd: str) -> tuple[str, str]:
@@ -334,7 +441,7 @@ def sanitize_automation_cmd(cmd: str) -> tuple[str, str]:
     parts = cmd.strip().split(None, 1)
     func = parts[0].lower() if parts else ""
     raw_arg = parts[1] if len(parts) > 1 else ""
-    sanitized_arg = re.sub(r"[()]", "", raw_arg).strip()
+    sanitized_arg = raw_arg.translate(_NO_PARENS).strip()
     return func, sanitized_arg
 
 def handle_url_open(arg: str):
@@ -342,15 +449,14 @@ def handle_url_open(arg: str):
     arg = arg.strip()
     logging.info(f"Attempting to open: {arg}")
     try:
-        parsed = urlparse(arg)
-        is_url = (parsed.scheme in ("http", "https")) or (not parsed.scheme and parsed.path.lower().startswith("www."))
-        if is_url:
-            url = arg if parsed.scheme else f"https://{arg}"
+        url_match = _URL_RE.match(arg)
+        if url_match:
+            url = arg if url_match.group(1) else f"https://{arg}"
             logging.info(f"Identified as URL, opening: {url}")
-            webbrowser.open(url)
+            webbrowser.open_new_tab(url)
             set_assistant_status("Opening URL...")
             response_text = f"Opening {arg} in your web browser."
-            show_text_to_screen(answer_modifier(f"{ASSISTANT_NAME}: {response_text}"))
+            show_text_to_screen(f"{ASSISTANT_NAME}: {response_text}")
             save_message_to_chatlog("assistant", response_text)
             TextToSpeech(f"Opening {arg.split('.')[0]}")
             set_assistant_status("Available...")
@@ -360,7 +466,7 @@ def handle_url_open(arg: str):
     except Exception as e:
         logging.error(f"Error handling open command for '{arg}': {e}", exc_info=True)
         error_message = f"Sorry, I couldn't open '{arg}'."
-        show_text_to_screen(answer_modifier(f"{ASSISTANT_NAME}: {error_message}"))
+        show_text_to_screen(f"{ASSISTANT_NAME}: {error_message}")
         save_message_to_chatlog("assistant", error_message)
         TextToSpeech(error_message)
         set_assistant_status("Available...")
@@ -371,22 +477,26 @@ def execute_automation_command(command: str):
     logging.info(f"Executing automation command: {command}")
     set_assistant_status(f"Executing: {command[:20]}...")
     try:
-        asyncio_run(Automation([command]))
+        future = submit_coroutine(Automation([command]))
+        try:
+            future.result(timeout=AUTOMATION_TIMEOUT)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise RuntimeError(f"Automation did not finish within {AUTOMATION_TIMEOUT:g}s")
         response_text = f"Executed command: {command}."
         logging.info(response_text)
-        show_text_to_screen(answer_modifier(f"{ASSISTANT_NAME}: {response_text}"))
+        show_text_to_screen(f"{ASSISTANT_NAME}: {response_text}")
         save_message_to_chatlog("assistant", response_text)
         action_verb = command.split()[0].capitalize()
         TextToSpeech(f"Executed {action_verb}")
     except Exception as e:
         logging.error(f"Error executing automation command '{command}': {e}", exc_info=True)
         error_message = f"Sorry, I failed to execute: {command}."
-        show_text_to_screen(answer_modifier(f"{ASSISTANT_NAME}: {error_message}"))
+        show_text_to_screen(f"{ASSISTANT_NAME}: {error_message}")
         save_message_to_chatlog("assistant", error_message)
         TextToSpeech("Sorry, I couldn't do that.")
     finally:
-        # Use imported get_assistant_status
-         if not EXIT_REQUESTED and "Available..." not in get_assistant_status():
+         if not EXIT_REQUESTED and get_assistant_status() != "Available...":
              set_assistant_status("Available...")
 
 
@@ -401,12 +511,33 @@ def handle_dmm_decisions(decisions: list[str], original_query: str):
         handle_general(original_query)
         return
 
-    exit_cmds = ["exit", "quit", "goodbye", "bye", "shutdown"]
-    if any(d.strip().lower() in exit_cmds for d in decisions):
+    # One pass sorts every decision into its bucket; the buckets are then handled in
+    # priority order (exit > automation > image > realtime > general)
+    exit_requested = False
+    automation_cmd = None
+    image_prompts, realtime_queries, general_queries = [], [], []
+    for d in decisions:
+        stripped = d.strip()
+        lowered = stripped.lower()
+        if lowered in _EXIT_COMMANDS:
+            exit_requested = True
+            break
+        if lowered.startswith("generate "):
+            image_prompts.append(stripped[len("generate "):].strip())
+        elif lowered.startswith("realtime "):
+            realtime_queries.append(stripped[len("realtime "):].strip())
+        elif lowered.startswith("general "):
+            general_queries.append(stripped[len("general "):].strip())
+        elif automation_cmd is None:
+            words = lowered.split(None, 1)
+            if words and words[0] in _FUNCTION_SET:
+                automation_cmd = d # Only the first automation command is executed
+
+    if exit_requested:
         logging.info("Exit command detected in decisions.")
         set_assistant_status("Shutting down...")
         response_text = f"Goodbye {USERNAME}!"
-        show_text_to_screen(answer_modifier(f"{ASSISTANT_NAME}: {response_text}"))
+        show_text_to_screen(f"{ASSISTANT_NAME}: {response_text}")
         TextToSpeech(response_text)
         EXIT_REQUESTED = True
         try:
@@ -415,20 +546,15 @@ def handle_dmm_decisions(decisions: list[str], original_query: str):
         except Exception as e: logging.error(f"Failed to set EXIT_REQUESTED status: {e}")
         return
 
-    executed_automation = False
-    for d in decisions:
-        func, arg = sanitize_automation_cmd(d)
-        if func in FUNCTIONS:
-            logging.info(f"Prioritizing automation command: {d}")
-            if func == "open": handle_url_open(arg)
-            else: execute_automation_command(d)
-            executed_automation = True
-            break
-    if executed_automation: return
+    if automation_cmd is not None:
+        func, arg = sanitize_automation_cmd(automation_cmd)
+        logging.info(f"Prioritizing automation command: {automation_cmd}")
+        if func == "open": handle_url_open(arg)
+        else: execute_automation_command(automation_cmd)
+        return
 
-    image_cmds = [d for d in decisions if d.strip().lower().startswith("generate ")]
-    if image_cmds:
-        prompt = image_cmds[0].strip()[len("generate "):].strip()
+    if image_prompts:
+        prompt = image_prompts[0]
         if prompt:
             logging.info(f"Prioritizing image generation with prompt: {prompt[:50]}...")
             handle_image_generation(prompt)
@@ -437,17 +563,15 @@ def handle_dmm_decisions(decisions: list[str], original_query: str):
             handle_general("You asked me to generate an image, but didn't provide a description.")
         return
 
-    realtime_cmds = [d for d in decisions if d.strip().lower().startswith("realtime ")]
-    if realtime_cmds:
-        combined_query = " and ".join([d.strip()[len("realtime "):].strip() for d in realtime_cmds])
+    if realtime_queries:
+        combined_query = " and ".join(realtime_queries)
         if not combined_query: combined_query = original_query
         logging.info(f"Handling combined real-time query: {combined_query[:50]}...")
         handle_realtime(combined_query)
         return
 
-    general_cmds = [d for d in decisions if d.strip().lower().startswith("general ")]
-    if general_cmds:
-        combined_query = " ".join([d.strip()[len("general "):].strip() for d in general_cmds])
+    if general_queries:
+        combined_query = " ".join(general_queries)
         if not combined_query: combined_query = original_query
         logging.info(f"Handling combined general query: {combined_query[:50]}...")
         handle_general(combined_query)
@@ -459,39 +583,33 @@ def handle_dmm_decisions(decisions: list[str], original_query: str):
 # ─── CORE EXECUTION FLOW ──────────────────────────────────────────────────────
 
 def microphone_thread_loop():
-    """Continuously checks microphone status and triggers main execution if active."""
+    """Waits for the microphone to be switched on and triggers main execution while it is."""
     global EXIT_REQUESTED
     logging.info("Microphone monitoring thread started.")
     while not EXIT_REQUESTED:
         try:
-            # Use imported get_microphone_status (returns bool)
-            mic_on = get_microphone_status()
-            if mic_on:
-                # Use imported get_assistant_status
-                current_status = get_assistant_status()
-                if "Listening..." not in current_status and "Thinking..." not in current_status \
-                   and "Answering..." not in current_status and "Executing..." not in current_status \
-                   and "Searching..." not in current_status and "Generating..." not in current_status:
-                    main_execution_cycle()
-                else: sleep(0.1)
-            else:
-                # Use imported get_assistant_status
-                current_status = get_assistant_status()
-                if "Available..." not in current_status and "Error" not in current_status \
-                    and "Shutting down..." not in current_status and not EXIT_REQUESTED \
-                    and "EXIT_REQUESTED" not in current_status:
-                    if "Generating Image..." not in current_status:
-                         set_assistant_status("Available...")
-                sleep(0.2)
+            # Blocks on the GUI's mic event instead of polling; the timeout only lets the
+            # loop notice EXIT_REQUESTED. Status is set back to "Available..." by the
+            # handlers themselves when a cycle ends, so nothing needs fixing up while idle.
+            if not wait_for_microphone_on(MIC_WAIT_TIMEOUT):
+                continue
+            if get_assistant_status() not in _BUSY_STATUSES:
+                main_execution_cycle()
+            else: sleep(0.1)
         except Exception as e:
             logging.error(f"Error in microphone_thread_loop: {e}", exc_info=True)
             sleep(5)
     logging.info("Microphone monitoring thread finished.")
 
 
+def _clear_error_status():
+    """Timer callback: returns to Available unless a new cycle has already moved on."""
+    if not EXIT_REQUESTED and get_assistant_status() == "Error!":
+        set_assistant_status("Available...")
+
 def main_execution_cycle():
     """Handles one cycle of listening, processing, and responding."""
-    global EXIT_REQUESTED
+    global EXIT_REQUESTED, _error_status_timer
     if EXIT_REQUESTED: return
 
     logging.info("--- Start Main Execution Cycle ---")
@@ -513,8 +631,7 @@ def main_execution_cycle():
             return
 
         logging.info(f"User query: '{query}'")
-        # Use imported answer_modifier
-        show_text_to_screen(answer_modifier(f"{USERNAME}: {query}"))
+        show_text_to_screen(f"{USERNAME}: {query}")
         save_message_to_chatlog("user", query)
         set_assistant_status("Thinking...")
         decisions = FirstLayerDMM(query)
@@ -524,22 +641,19 @@ def main_execution_cycle():
         logging.error(f"Error in main_execution_cycle (Query: '{query}'): {e}", exc_info=True)
         error_message = "Sorry, an unexpected error occurred while processing your request."
         try:
-            show_text_to_screen(answer_modifier(f"{ASSISTANT_NAME}: {error_message}"))
+            show_text_to_screen(f"{ASSISTANT_NAME}: {error_message}")
             save_message_to_chatlog("assistant", error_message)
             TextToSpeech(error_message)
         except Exception as ie: logging.error(f"Failed to report main execution error: {ie}")
         finally:
              if not EXIT_REQUESTED:
+                 # Shown for a moment without holding up the microphone thread
                  set_assistant_status("Error!")
-                 sleep(2)
-                 set_assistant_status("Available...")
+                 _error_status_timer = threading.Timer(ERROR_STATUS_SECONDS, _clear_error_status)
+                 _error_status_timer.daemon = True
+                 _error_status_timer.start()
     finally:
-        # Use imported get_assistant_status
-        current_status = get_assistant_status()
-        if not EXIT_REQUESTED and "Available..." not in current_status \
-           and "Shutting down..." not in current_status \
-           and "EXIT_REQUESTED" not in current_status \
-           and "Generating Image..." not in current_status:
+        if not EXIT_REQUESTED and get_assistant_status() not in _CYCLE_END_KEEP_STATUSES:
             set_assistant_status("Available...")
         logging.info("--- End Main Execution Cycle ---")
 
@@ -552,6 +666,7 @@ def run_app():
 
     try:
         initial_setup()
+        threading.Thread(target=preload_backend, name="BackendPreload", daemon=True).start()
         mic_thread = threading.Thread(target=microphone_thread_loop, daemon=True)
         mic_thread.start()
         logging.info("Starting graphical_user_interface()...")
@@ -567,22 +682,9 @@ def run_app():
             logging.info("Waiting for microphone thread to exit...")
             mic_thread.join(timeout=2)
             if mic_thread.is_alive(): logging.warning("Microphone thread did not exit cleanly.")
+        if _error_status_timer is not None: _error_status_timer.cancel()
+        _async_loop.call_soon_threadsafe(_async_loop.stop)
 
-        logging.info(f"Terminating {len(SUBPROCESS_LIST)} tracked subprocess(es)...")
-        active_subprocesses = [p for p in SUBPROCESS_LIST if p.poll() is None]
-        logging.info(f"Found {len(active_subprocesses)} active subprocess(es).")
-        for proc in active_subprocesses:
-            try:
-                logging.info(f"Terminating process {proc.pid}...")
-                proc.terminate()
-                proc.wait(timeout=0.5)
-                if proc.poll() is None:
-                    logging.warning(f"Process {proc.pid} did not terminate gracefully. Killing.")
-                    proc.kill()
-                    proc.wait(timeout=0.5)
-            except ProcessLookupError: logging.warning(f"Process {proc.pid} already finished.")
-            except Exception as e: logging.error(f"Error terminating subprocess {proc.pid}: {e}", exc_info=True)
-        SUBPROCESS_LIST.clear()
         logging.info("Shutdown sequence complete.")
 
 # ─── ENTRY POINT ──────────────────────────────────────────────────────────────
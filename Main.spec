@@ -6,7 +6,8 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[('Frontend/Graphics', 'Graphics'), ('Frontend/Files', 'Files'), ('Backend', 'Backend'), ('Data', 'Data'), ('Webdriver', 'Webdriver'), ('.env', '.')],
-    hiddenimports=[],
+    # Main.py imports these through importlib on first use, which PyInstaller cannot see
+    hiddenimports=['Backend.Chatbot', 'Backend.Model', 'Backend.RealtimeSearchEngine', 'Backend.Automation', 'Backend.SpeechToText', 'Backend.TextToSpeech', 'Backend.ImageGeneration', 'aiohttp'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],